@@ -1,17 +1,30 @@
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 import os
-from dotenv import load_dotenv
+import sys
 
-load_dotenv()
+def _bootstrap_env():
+    # Settings below are read from the environment at import time, so .env
+    # has to be loaded first; SKIP_DOTENV=1 skips it for short-lived tools.
+    if os.getenv("SKIP_DOTENV") == "1":
+        return
+    from dotenv import load_dotenv
+    load_dotenv()
+
+_bootstrap_env()
 
 class NetworkConfig:
     LISTEN_PORT = int(os.getenv("LISTEN_PORT", 8000))
-    BOOTSTRAP_PEERS = os.getenv("BOOTSTRAP_PEERS", "").split(",") if os.getenv("BOOTSTRAP_PEERS") else []
+    BOOTSTRAP_PEERS = tuple(p for p in os.getenv("BOOTSTRAP_PEERS", "").split(",") if p)
+    BOOTSTRAP_PEER_SET = frozenset(BOOTSTRAP_PEERS)
     MAX_PEER_CONNECTIONS = 100
     MESSAGE_TIMEOUT = 30
     HEARTBEAT_INTERVAL = 5
     REQUEST_RETRIES = 3
+    TX_BATCH_MAX = 400
+    TX_BATCH_DELAY = 0.005  # seconds to let concurrent broadcasts coalesce
+    PIPELINE_DEPTH = 3  # consensus rounds a node keeps in flight at once
+    OUTBOX_MAX = 1000  # outgoing messages held before the oldest are dropped
 
 class BlockchainConfig:
     GENESIS_HASH = "0"
@@ -122,6 +135,11 @@ TIER_LATENCY_TARGET: Dict[Tier, float] = {
     Tier.TIER_3: 500,
 }
 
+# Same tables indexed by tier.value - 1, for hot paths that skip the enum hash
+TIER_CERT: Tuple[float, ...] = tuple(TIER_CERTIFICATION[t] for t in Tier)
+TIER_LAT: Tuple[float, ...] = tuple(float(TIER_LATENCY_TARGET[t]) for t in Tier)
+TIER_NAMES: Tuple[str, ...] = tuple(sys.intern(t.name) for t in Tier)
+
 class RuntimeFlags:
     ENABLE_CAMTC = True
     ENABLE_ML_OPTIMIZATION = False
@@ -1,11 +1,18 @@
 
 import asyncio
+import bisect
 import time
-from typing import List, Dict, Set, Optional, Any
+from collections import defaultdict
+import numpy as np
+from typing import List, Dict, Tuple, Optional, Any, Union, Callable, Awaitable, Set
 from core.block import Block
 from core.transaction import Transaction
 from consensus.validator import Validator
-from config import ConsensusConfig, ValidatorConfig
+from utils.log import get_logger
+from utils.serialization import dumps
+from config import ConsensusConfig, PriorityConfig
+
+logger = get_logger("pbft")
 
 
 class PBFTMessage:
@@ -16,6 +23,7 @@ class PBFTMessage:
         self.content = content
         self.sender = sender
         self.timestamp = time.time()
+        self._payload: Optional[bytes] = None
     
     def to_dict(self) -> Dict:
         return {
@@ -24,6 +32,33 @@ class PBFTMessage:
             "sender": self.sender,
             "timestamp": self.timestamp
         }
+    
+    def to_bytes(self) -> bytes:
+        """Encode the message for the wire once and reuse it for every peer."""
+        if self._payload is None:
+            self._payload = dumps(self.to_dict())
+        return self._payload
+
+
+class VoteTally:
+    """Votes for one block: a byte per validator index plus a running count."""
+    
+    __slots__ = ("bits", "count")
+    
+    def __init__(self, n: int):
+        self.bits = bytearray(n)
+        self.count = 0
+    
+    def add(self, idx: int):
+        if not self.bits[idx]:
+            self.bits[idx] = 1
+            self.count += 1
+    
+    def __contains__(self, idx: int) -> bool:
+        return bool(self.bits[idx])
+    
+    def __len__(self) -> int:
+        return self.count
 
 
 class PBFTConsensus:
@@ -34,14 +69,31 @@ class PBFTConsensus:
     For 7 validators: f = 2 (tolerate 2 malicious)
     """
     
-    def __init__(self, validator: Validator, all_validators: List[Validator]):
-        """Initialize PBFT consensus."""
+    def __init__(self,
+                 validator: Validator,
+                 all_validators: List[Validator],
+                 transport: Optional[Callable[[Validator, bytes], Awaitable[None]]] = None):
+        """
+        Initialize PBFT consensus.
+        
+        transport, if given, is awaited as transport(peer, payload) to
+        deliver an encoded message to one peer.
+        """
         self.validator = validator
-        self.all_validators = all_validators
+        self.all_validators: Tuple[Validator, ...] = tuple(all_validators)
+        self.transport = transport
         self.n = len(all_validators)
         self.f = (self.n - 1) // 3  # Byzantine fault tolerance
         self.quorum = 2 * self.f + 1
         
+        # Validators are referred to by position from here on
+        self._validator_index: Dict[str, int] = {
+            v.public_key: i for i, v in enumerate(all_validators)
+        }
+        if validator.public_key not in self._validator_index:
+            raise ValueError(f"Validator {validator.id} is not part of the validator set")
+        self._my_idx = self._validator_index[validator.public_key]
+        
         # State tracking
         self.round = 0
         self.view = 0
@@ -49,16 +101,56 @@ class PBFTConsensus:
         
         # Message logs
         self.pre_prepare_log: Dict[int, PBFTMessage] = {}
-        self.prepare_log: Dict[str, Set[str]] = {}  # block_hash -> set of validators
-        self.commit_log: Dict[str, Set[str]] = {}   # block_hash -> set of validators
+        self.prepare_log: Dict[str, VoteTally] = {}  # block_hash -> votes by validator index
+        self.commit_log: Dict[str, VoteTally] = {}   # block_hash -> votes by validator index
         
         # Timers for timeout
         self.timers: Dict[str, asyncio.Task] = {}
+        
+        # Broadcasts still being delivered; held so they aren't garbage collected
+        self._pending_sends: Set[asyncio.Task] = set()
+        
+        # Signalled as soon as a phase's condition is met, so waiters wake
+        # immediately. An entry exists only while someone waits on it
+        self._pre_prepare_events: Dict[int, asyncio.Event] = defaultdict(asyncio.Event)
+        self._prepare_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._commit_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        # Coroutines currently waiting on each of those events
+        self._waiters: Dict[asyncio.Event, int] = defaultdict(int)
+    
+    async def broadcast(self, msg: PBFTMessage):
+        """
+        Send a message to every other validator concurrently.
+        
+        Returns once delivery is scheduled: a phase only needs a quorum of
+        votes back, so it shouldn't wait on the slowest peer's send.
+        """
+        if self.transport is None:
+            return
+        
+        task = asyncio.create_task(self._send_all(msg.to_bytes()))
+        self._pending_sends.add(task)
+        task.add_done_callback(self._send_done)
+    
+    async def _send_all(self, payload: bytes):
+        await asyncio.gather(*(
+            self.transport(peer, payload)
+            for peer in self.all_validators
+            if peer is not self.validator
+        ))
+    
+    def _send_done(self, task: asyncio.Task):
+        self._pending_sends.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("[PBFT] %s: Broadcast failed: %r", self.validator.id, task.exception())
     
     def select_primary(self) -> Validator:
         """Select primary validator for this view (round-robin)."""
-        primary_idx = self.view % self.n
-        return self.all_validators[primary_idx]
+        return self.all_validators[self.view % self.n]
+    
+    def is_primary(self) -> bool:
+        """Whether this node is primary for the current view."""
+        return self._my_idx == self.view % self.n
     
     async def pre_prepare_phase(self, block: Block) -> bool:
         """
@@ -66,14 +158,12 @@ class PBFTConsensus:
         
         Returns True if quorum accepts block.
         """
-        primary = self.select_primary()
-        
-        if self.validator.public_key != primary.public_key:
+        if not self.is_primary():
             # We're not primary, wait for message
             return await self._wait_pre_prepare(block)
         
         # We ARE primary, broadcast proposal
-        print(f"[PBFT] Primary {self.validator.id}: Pre-prepare block #{block.index}")
+        logger.debug("[PBFT] Primary %s: Pre-prepare block #%d", self.validator.id, block.index)
         
         msg = PBFTMessage(
             "PRE_PREPARE",
@@ -85,8 +175,9 @@ class PBFTConsensus:
             self.validator.public_key
         )
         
-        self.pre_prepare_log[block.index] = msg
+        self.record_pre_prepare(block.index, msg)
         self.current_block = block
+        await self.broadcast(msg)
         
         return True
     
@@ -96,11 +187,11 @@ class PBFTConsensus:
         
         Need 2f + 1 votes (including self).
         """
-        print(f"[PBFT] {self.validator.id}: Prepare phase for block #{block.index}")
+        logger.debug("[PBFT] %s: Prepare phase for block #%d", self.validator.id, block.index)
         
         # Validate block
         if not block.verify_all():
-            print(f"[PBFT] {self.validator.id}: Block validation failed!")
+            logger.warning("[PBFT] %s: Block validation failed!", self.validator.id)
             return False
         
         # Vote
@@ -113,26 +204,19 @@ class PBFTConsensus:
             self.validator.public_key
         )
         
-        # Track votes
-        if block.hash not in self.prepare_log:
-            self.prepare_log[block.hash] = set()
-        
-        self.prepare_log[block.hash].add(self.validator.public_key)
+        # Track votes; the set keeps filling in place as other validators' votes arrive
+        q = self.quorum
+        votes = self.record_prepare(block.hash, self.validator.public_key)
+        await self.broadcast(msg)
         
-        # Simulate collecting votes from other validators
-        # In real network, messages would arrive
-        vote_count = len(self.prepare_log[block.hash])
-        
-        print(f"[PBFT] {self.validator.id}: Prepare votes: {vote_count}/{self.n}")
+        logger.debug("[PBFT] %s: Prepare votes: %d/%d", self.validator.id, len(votes), self.n)
         
         # Need quorum to proceed
-        if vote_count < self.quorum:
-            print(f"[PBFT] {self.validator.id}: Not enough prepare votes, waiting...")
-            # In real system, wait for messages
-            await asyncio.sleep(ConsensusConfig.PREPARE_TIMEOUT)
-            vote_count = len(self.prepare_log.get(block.hash, set()))
+        if len(votes) < q:
+            logger.debug("[PBFT] %s: Not enough prepare votes, waiting...", self.validator.id)
+            await self._wait_for(self._prepare_events, block.hash, ConsensusConfig.PREPARE_TIMEOUT)
         
-        return vote_count >= self.quorum
+        return len(votes) >= q
     
     async def commit_phase(self, block: Block) -> bool:
         """
@@ -140,7 +224,7 @@ class PBFTConsensus:
         
         Once 2f + 1 commits, block is final.
         """
-        print(f"[PBFT] {self.validator.id}: Commit phase for block #{block.index}")
+        logger.debug("[PBFT] %s: Commit phase for block #%d", self.validator.id, block.index)
         
         # Commit vote
         msg = PBFTMessage(
@@ -152,21 +236,17 @@ class PBFTConsensus:
             self.validator.public_key
         )
         
-        if block.hash not in self.commit_log:
-            self.commit_log[block.hash] = set()
-        
-        self.commit_log[block.hash].add(self.validator.public_key)
-        
-        commit_count = len(self.commit_log[block.hash])
+        q = self.quorum
+        votes = self.record_commit(block.hash, self.validator.public_key)
+        await self.broadcast(msg)
         
-        print(f"[PBFT] {self.validator.id}: Commit votes: {commit_count}/{self.n}")
+        logger.debug("[PBFT] %s: Commit votes: %d/%d", self.validator.id, len(votes), self.n)
         
         # Need quorum
-        if commit_count < self.quorum:
-            await asyncio.sleep(ConsensusConfig.COMMIT_TIMEOUT)
-            commit_count = len(self.commit_log.get(block.hash, set()))
+        if len(votes) < q:
+            await self._wait_for(self._commit_events, block.hash, ConsensusConfig.COMMIT_TIMEOUT)
         
-        return commit_count >= self.quorum
+        return len(votes) >= q
     
     async def run_consensus(self, block: Block) -> bool:
         """
@@ -174,40 +254,96 @@ class PBFTConsensus:
         
         Returns True if block is finalized.
         """
-        print(f"\n[PBFT] Starting consensus for block #{block.index}")
-        print(f"[PBFT] View: {self.view}, Round: {self.round}")
+        logger.info("[PBFT] Starting consensus for block #%d", block.index)
+        logger.debug("[PBFT] View: %d, Round: %d", self.view, self.round)
         
         # Phase 1: Pre-prepare
         if not await self.pre_prepare_phase(block):
-            print(f"[PBFT] ✗ Pre-prepare failed")
+            logger.warning("[PBFT] ✗ Pre-prepare failed")
             return False
         
         # Phase 2: Prepare
         if not await self.prepare_phase(block):
-            print(f"[PBFT] ✗ Prepare failed")
+            logger.warning("[PBFT] ✗ Prepare failed")
             return False
         
         # Phase 3: Commit
         if not await self.commit_phase(block):
-            print(f"[PBFT] ✗ Commit failed")
+            logger.warning("[PBFT] ✗ Commit failed")
             return False
         
-        print(f"[PBFT] ✓ Block #{block.index} FINALIZED!")
+        logger.info("[PBFT] ✓ Block #%d FINALIZED!", block.index)
         self.round += 1
         return True
     
+    def record_pre_prepare(self, block_index: int, msg: PBFTMessage):
+        """Log a pre-prepare message and wake anyone waiting on it."""
+        self.pre_prepare_log[block_index] = msg
+        event = self._pre_prepare_events.get(block_index)
+        if event is not None:
+            event.set()
+    
+    def _record_vote(self,
+                     log: Dict[str, VoteTally],
+                     events: Dict[str, asyncio.Event],
+                     block_hash: str,
+                     sender: str) -> VoteTally:
+        votes = log.get(block_hash)
+        if votes is None:
+            votes = log[block_hash] = VoteTally(self.n)
+        
+        # Votes from keys outside the validator set are ignored
+        idx = self._validator_index.get(sender)
+        if idx is not None:
+            votes.add(idx)
+            event = events.get(block_hash)
+            if event is not None and votes.count >= self.quorum:
+                event.set()
+        return votes
+    
+    def record_prepare(self, block_hash: str, sender: str) -> VoteTally:
+        """Log a prepare vote; signal waiters once quorum is reached."""
+        return self._record_vote(self.prepare_log, self._prepare_events, block_hash, sender)
+    
+    def record_commit(self, block_hash: str, sender: str) -> VoteTally:
+        """Log a commit vote; signal waiters once quorum is reached."""
+        return self._record_vote(self.commit_log, self._commit_events, block_hash, sender)
+    
+    async def _wait_event(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait for an event to be set, giving up after timeout seconds."""
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+    
+    async def _wait_for(self, events: Dict[Any, asyncio.Event], key: Any, timeout: float) -> bool:
+        """Wait on the event for key, dropping it once its last waiter is done."""
+        event = events[key]
+        self._waiters[event] += 1
+        try:
+            return await self._wait_event(event, timeout)
+        finally:
+            self._waiters[event] -= 1
+            if not self._waiters[event]:
+                del self._waiters[event]
+                if events.get(key) is event:
+                    del events[key]
+    
     async def _wait_pre_prepare(self, block: Block) -> bool:
         """Wait for pre-prepare message from primary."""
-        start = time.time()
-        timeout = ConsensusConfig.PRE_PREPARE_TIMEOUT
-        
-        while time.time() - start < timeout:
-            # In real system, check message queue
-            if block.index in self.pre_prepare_log:
-                return True
-            await asyncio.sleep(0.1)
-        
-        return False
+        if block.index in self.pre_prepare_log:
+            return True
+        return await self._wait_for(self._pre_prepare_events, block.index, ConsensusConfig.PRE_PREPARE_TIMEOUT)
+
+
+# Priorities above each threshold fall into the next tier of _QUORUM_BY_TIER
+_PRIORITY_THRESHOLDS = (PriorityConfig.NORMAL_THRESHOLD, PriorityConfig.EMERGENCY_THRESHOLD)
+_QUORUM_BY_TIER = (
+    ConsensusConfig.QUORUM_ROUTINE,
+    ConsensusConfig.QUORUM_NORMAL,
+    ConsensusConfig.QUORUM_EMERGENCY,
+)
 
 
 class AdaptiveQuorum:
@@ -218,26 +354,22 @@ class AdaptiveQuorum:
     """
     
     @staticmethod
-    def calculate(priority: float, validator_scores: List[float]) -> float:
+    def calculate(priority: float, validator_scores: Union[np.ndarray, List[float]]) -> float:
         """
         Calculate required quorum score.
         
         Args:
             priority: Transaction priority (0-1)
-            validator_scores: List of validator scores
+            validator_scores: Validator scores, ideally a pre-built float64
+                array such as ValidatorSet.v_scores()
         
         Returns:
             Required total score for quorum
         """
-        total_score = sum(validator_scores)
-        
-        # Adaptive quorum based on priority
-        if priority > 0.8:  # Emergency
-            quorum_pct = ConsensusConfig.QUORUM_EMERGENCY
-        elif priority > 0.3:  # Normal
-            quorum_pct = ConsensusConfig.QUORUM_NORMAL
-        else:  # Routine
-            quorum_pct = ConsensusConfig.QUORUM_ROUTINE
+        total_score = float(np.asarray(validator_scores, dtype=np.float64).sum())
+        
+        # Adaptive quorum based on priority: routine, normal, emergency
+        quorum_pct = _QUORUM_BY_TIER[bisect.bisect_left(_PRIORITY_THRESHOLDS, priority)]
         
         return quorum_pct * total_score
  
\ No newline at end of file
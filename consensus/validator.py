@@ -1,11 +1,31 @@
 import time
-from typing import Optional, Dict, Any
-from utils.crypto import generate_keypair, sha256_hash
-from config import ValidatorScoringConfig, Tier, TIER_CERTIFICATION, TIER_LATENCY_TARGET
+import numpy as np
+from typing import Optional, Dict, Any, Final, List, Tuple, Iterable
+from utils import scoring
+from utils.crypto import generate_keypair
+from config import ValidatorConfig, Tier, TIER_CERT, TIER_LAT, TIER_NAMES
+
+MAX_STAKE: Final[float] = ValidatorConfig.MAX_STAKE
+REPUTATION_DECAY: Final[float] = ValidatorConfig.REPUTATION_DECAY
+
+# (count, stake, tier, name prefix) for each validator tier
+VALIDATOR_SPECS = (
+    (ValidatorConfig.TIER_1_COUNT, 500, Tier.TIER_1, "T1"),
+    (ValidatorConfig.TIER_2_COUNT, 300, Tier.TIER_2, "T2"),
+    (ValidatorConfig.TIER_3_COUNT, 100, Tier.TIER_3, "T3"),
+)
 
 class Validator:
     
+    __slots__ = ("id", "tier", "public_key", "private_key", "blocks_validated",
+                 "correct_votes", "incorrect_votes", "last_active", "_certification",
+                 "_stake", "_stake_norm", "_latency_ms", "_latency_inv", "_uptime",
+                 "_reputation", "_v_score_cache", "_membership")
+    
     def __init__(self, validator_id: str, stake: float, tier: Tier):
+        self._v_score_cache: Optional[float] = None
+        self._membership: Optional[Tuple["ValidatorSet", int]] = None
+        
         self.id = validator_id
         self.stake = stake
         self.tier = tier
@@ -18,14 +38,66 @@ class Validator:
         self.incorrect_votes = 0
         self.last_active = time.time()
         
-        self.latency_ms = TIER_LATENCY_TARGET[tier]
+        self.latency_ms = TIER_LAT[tier.value - 1]
         self.uptime = 0.99
         
-        self.certification = TIER_CERTIFICATION[tier]
+        self.certification = TIER_CERT[tier.value - 1]
+    
+    @property
+    def stake(self) -> float:
+        return self._stake
+    
+    @stake.setter
+    def stake(self, value: float):
+        self._stake = value
+        self._stake_norm = min(value / MAX_STAKE, 1.0)
+        self._invalidate()
+    
+    @property
+    def latency_ms(self) -> float:
+        return self._latency_ms
+    
+    @latency_ms.setter
+    def latency_ms(self, value: float):
+        self._latency_ms = value
+        self._latency_inv = 1.0 / (1 + value)
+        self._invalidate()
+    
+    @property
+    def uptime(self) -> float:
+        return self._uptime
+    
+    @uptime.setter
+    def uptime(self, value: float):
+        self._uptime = value
+        self._invalidate()
+    
+    @property
+    def certification(self) -> float:
+        return self._certification
+    
+    @certification.setter
+    def certification(self, value: float):
+        self._certification = value
+        self._invalidate()
+    
+    @property
+    def reputation(self) -> float:
+        return self._reputation
+    
+    @reputation.setter
+    def reputation(self, value: float):
+        self._reputation = value
+        self._invalidate()
+    
+    def _invalidate(self):
+        self._v_score_cache = None
+        if self._membership is not None:
+            validator_set, slot = self._membership
+            validator_set.refresh(slot)
     
     def update_reputation(self, performance: float):
-        decay = 0.7
-        self.reputation = decay * self.reputation + (1 - decay) * performance
+        self.reputation = REPUTATION_DECAY * self._reputation + (1 - REPUTATION_DECAY) * performance
     
     def record_vote(self, correct: bool):
         if correct:
@@ -39,28 +111,24 @@ class Validator:
         self.last_active = time.time()
     
     def calculate_v_score(self) -> float:
-        max_stake = 1_000_000
-        stake_norm = min(self.stake / max_stake, 1.0)
-        
-        latency_inv = 1.0 / (1 + self.latency_ms)
+        if self._v_score_cache is not None:
+            return self._v_score_cache
         
-        w = ValidatorScoringConfig
-        v_score = (
-            w.W_STAKE * stake_norm +
-            w.W_REPUTATION * self.reputation +
-            w.W_LATENCY * latency_inv +
-            w.W_CERTIFICATION * self.certification +
-            w.W_UPTIME * self.uptime
+        self._v_score_cache = scoring.v_score(
+            self._stake_norm,
+            self._reputation,
+            self._latency_inv,
+            self._certification,
+            self._uptime
         )
-        
-        return min(max(v_score, 0.0), 1.0)
+        return self._v_score_cache
     
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
             "public_key": self.public_key,
             "stake": self.stake,
-            "tier": self.tier.name,
+            "tier": TIER_NAMES[self.tier.value - 1],
             "reputation": round(self.reputation, 3),
             "v_score": round(self.calculate_v_score(), 3),
             "blocks_validated": self.blocks_validated,
@@ -73,7 +141,70 @@ class Validator:
     def __repr__(self) -> str:
         v_score = self.calculate_v_score()
         return (f"Validator({self.id} | "
-                f"Tier={self.tier.name} | "
+                f"Tier={TIER_NAMES[self.tier.value - 1]} | "
                 f"Stake={self.stake} | "
                 f"Rep={self.reputation:.2f} | "
                 f"Score={v_score:.2f})")
+
+
+class ValidatorSet:
+    """
+    Column-oriented view of a validator set for scoring.
+    
+    Each scoring input is kept in a contiguous float64 array indexed by
+    validator position; Validator setters write through to their column.
+    A validator can belong to only one set, since it writes through to one.
+    """
+    
+    def __init__(self, validators: List[Validator]):
+        for validator in validators:
+            if validator._membership is not None:
+                raise ValueError(f"Validator {validator.id} already belongs to a validator set")
+        
+        self.validators = validators
+        self.by_id: Dict[str, Validator] = {v.id: v for v in validators}
+        n = len(validators)
+        
+        self.stake_norms = np.empty(n, dtype=np.float64)
+        # Zeroed, not empty: refresh keeps reputation_sum by the change in each slot
+        self.reputations = np.zeros(n, dtype=np.float64)
+        self.reputation_sum = 0.0
+        self.latency_invs = np.empty(n, dtype=np.float64)
+        self.certifications = np.empty(n, dtype=np.float64)
+        self.uptimes = np.empty(n, dtype=np.float64)
+        
+        for slot, validator in enumerate(validators):
+            validator._membership = (self, slot)
+            self.refresh(slot)
+    
+    def refresh(self, slot: int):
+        v = self.validators[slot]
+        self.stake_norms[slot] = v._stake_norm
+        self.reputation_sum += v._reputation - self.reputations[slot]
+        self.reputations[slot] = v._reputation
+        self.latency_invs[slot] = v._latency_inv
+        self.certifications[slot] = v._certification
+        self.uptimes[slot] = v._uptime
+    
+    @property
+    def mean_reputation(self) -> float:
+        """Average reputation, kept current by refresh instead of re-summed."""
+        return self.reputation_sum / len(self.validators) if self.validators else 0.0
+    
+    def v_scores(self) -> np.ndarray:
+        scores = (
+            scoring.W_STAKE * self.stake_norms +
+            scoring.W_REPUTATION * self.reputations +
+            scoring.W_LATENCY * self.latency_invs +
+            scoring.W_CERTIFICATION * self.certifications +
+            scoring.W_UPTIME * self.uptimes
+        )
+        return np.clip(scores, 0.0, 1.0)
+    
+    def __len__(self) -> int:
+        return len(self.validators)
+
+
+def build_validators(specs: Iterable[Tuple[str, float, Tier]]) -> List[Validator]:
+    """Create one validator per (validator_id, stake, tier) spec, in order."""
+    return [Validator(validator_id, stake, tier) for validator_id, stake, tier in specs]
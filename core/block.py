@@ -1,57 +1,115 @@
 import time
-import json
+import struct
+import hashlib
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
 from core.transaction import Transaction
-from utils.crypto import sha256_hash
-from utils.hashing import merkle_root
+from utils.crypto import sha256_bytes
+from utils.hashing import merkle_root_from_leaves
+from utils.serialization import dumps
+
+def _header_field(name: str) -> property:
+    # Reassigning a header field after the hash is cached means the next
+    # verify_integrity has to recompute instead of trusting it; new
+    # transactions also need a new merkle root
+    slot = "_" + name
+    
+    def setter(self, value):
+        setattr(self, slot, value)
+        self._dirty = True
+        self._payload = None
+        if name == "transactions":
+            self._merkle_root = None
+    
+    return property(attrgetter(slot), setter)
 
 class Block:
     
+    __slots__ = ("_index", "_previous_hash", "_transactions", "_proposer", "_timestamp",
+                 "_merkle_root", "_hash", "_dirty", "_payload")
+    
+    index = _header_field("index")
+    previous_hash = _header_field("previous_hash")
+    transactions = _header_field("transactions")
+    proposer = _header_field("proposer")
+    timestamp = _header_field("timestamp")
+    
     def __init__(self,
                  index: int,
                  previous_hash: str,
                  transactions: List[Transaction],
                  proposer: str,
                  timestamp: Optional[float] = None):
-        self.index = index
-        self.previous_hash = previous_hash
-        self.transactions = transactions
-        self.proposer = proposer
-        self.timestamp = timestamp or time.time()
+        self._index = index
+        self._previous_hash = previous_hash
+        self._transactions = transactions
+        self._proposer = proposer
+        self._timestamp = timestamp or time.time()
         
-        self.merkle_root = self._calculate_merkle_root()
-        self.hash = self._calculate_hash()
+        self._merkle_root: Optional[str] = None
+        self._hash: Optional[str] = None
+        self._dirty = False
+        self._payload: Optional[bytes] = None
+    
+    @property
+    def merkle_root(self) -> str:
+        if self._merkle_root is None:
+            self._merkle_root = self._calculate_merkle_root()
+        return self._merkle_root
+    
+    @property
+    def hash(self) -> str:
+        if self._hash is None:
+            self._hash = self._calculate_hash()
+            self._dirty = False
+        return self._hash
     
     def _calculate_merkle_root(self) -> str:
         if not self.transactions:
-            return sha256_hash("empty")
+            return sha256_bytes(b"empty")
         
-        tx_dicts = [tx.to_dict() for tx in self.transactions]
-        return merkle_root(tx_dicts)
+        return merkle_root_from_leaves([tx.canonical_bytes() for tx in self.transactions])
     
-    def _calculate_hash(self) -> str:
-        block_data = {
-            "index": self.index,
-            "previous_hash": self.previous_hash,
-            "merkle_root": self.merkle_root,
-            "timestamp": self.timestamp,
-            "proposer": self.proposer
-        }
-        block_json = json.dumps(block_data, sort_keys=True)
-        return sha256_hash(block_json)
+    def _calculate_hash(self, merkle_root: Optional[str] = None) -> str:
+        previous_hash = self.previous_hash.encode('utf-8')
+        merkle = (merkle_root or self.merkle_root).encode('utf-8')
+        proposer = self.proposer.encode('utf-8')
+        
+        # Length-prefix the variable-width fields so the layout stays unambiguous
+        header = b''.join((
+            self.index.to_bytes(8, 'big'),
+            struct.pack('>H', len(previous_hash)), previous_hash,
+            struct.pack('>H', len(merkle)), merkle,
+            struct.pack('>d', self.timestamp),
+            struct.pack('>H', len(proposer)), proposer,
+        ))
+        return hashlib.sha256(header).hexdigest()
     
-    def verify_integrity(self) -> bool:
+    def verify_integrity(self, full: bool = False) -> bool:
+        """
+        Check the cached hash. The quick check only notices reassigned
+        header fields; full rebuilds the merkle root from the transactions,
+        so edits made inside them are caught too.
+        """
+        if self._hash is None:
+            return True
+        
+        if full:
+            return self._calculate_hash(self._calculate_merkle_root()) == self._hash
+        
+        if not self._dirty:
+            return True
+        
         recalculated_hash = self._calculate_hash()
-        return recalculated_hash == self.hash
+        return recalculated_hash == self._hash
     
     def verify_transactions(self) -> bool:
-        for tx in self.transactions:
-            if not tx.verify_signature():
-                return False
-        return True
+        # Serial on purpose: cryptography's Ed25519 verify holds the GIL,
+        # so a thread pool only adds dispatch overhead
+        return all(tx.verify_signature() for tx in self.transactions)
     
     def verify_all(self) -> bool:
-        return self.verify_integrity() and self.verify_transactions()
+        return self.verify_integrity(full=True) and self.verify_transactions()
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -64,6 +122,12 @@ class Block:
             "transactions": [tx.to_dict() for tx in self.transactions]
         }
     
+    def to_bytes(self) -> bytes:
+        # Blocks are not edited once built, so the encoded form is cached
+        if self._payload is None:
+            self._payload = dumps(self.to_dict())
+        return self._payload
+    
     def __repr__(self) -> str:
         status = "✓" if self.verify_integrity() else "✗"
         return (f"Block#{self.index} {status} | "
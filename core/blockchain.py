@@ -1,4 +1,4 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from core.block import Block
 from core.transaction import Transaction
 from core.mempool import Mempool
@@ -9,6 +9,9 @@ class Blockchain:
     def __init__(self):
         self.chain: List[Block] = []
         self.mempool = Mempool()
+        self.tx_index: Dict[str, Tuple[int, Transaction]] = {}
+        self.total_txs = 0
+        self._validated_up_to = 0
         self.create_genesis_block()
     
     def create_genesis_block(self):
@@ -28,8 +31,12 @@ class Blockchain:
             return False
         return self.mempool.add_transaction(tx)
     
-    def mine_block(self, proposer: str, tx_count: int = 10) -> Optional[Block]:
-        last_block = self.get_latest_block()
+    def mine_block(self,
+                   proposer: str,
+                   tx_count: int = 10,
+                   parent: Optional[Block] = None) -> Optional[Block]:
+        # parent lets a proposer build on a block that is still in consensus
+        last_block = parent or self.get_latest_block()
         
         transactions = self.mempool.get_transactions(tx_count)
         
@@ -48,31 +55,45 @@ class Blockchain:
     def add_block(self, block: Block) -> bool:
         last_block = self.get_latest_block()
         
-        if block.previous_hash != last_block.hash:
-            print(f"❌ Block references wrong previous hash!")
-            return False
-        
         if block.index != last_block.index + 1:
             print(f"❌ Block index incorrect!")
             return False
         
+        if block.previous_hash != last_block.hash:
+            print(f"❌ Block references wrong previous hash!")
+            return False
+        
         if not block.verify_integrity():
             print(f"❌ Block has been tampered with!")
             return False
         
+        # Always re-checked: a transaction can be edited after the block is
+        # mined. Unchanged ones answer from their cached signature check
         if not block.verify_transactions():
             print(f"❌ Block contains invalid transactions!")
             return False
         
+        # Pin the hash of the block as accepted; until it is computed,
+        # verify_integrity has nothing to compare later edits against
+        block.hash
         self.chain.append(block)
+        self._index_block(block)
+        
+        if self._validated_up_to == block.index - 1:
+            self._validated_up_to = block.index
         return True
     
-    def is_chain_valid(self) -> bool:
-        for i in range(1, len(self.chain)):
+    def _index_block(self, block: Block):
+        for tx in block.transactions:
+            self.tx_index[tx.id] = (block.index, tx)
+        self.total_txs += len(block.transactions)
+    
+    def _verify_range(self, lo: int, hi: int, full: bool = False) -> bool:
+        for i in range(lo, hi + 1):
             current = self.chain[i]
             previous = self.chain[i - 1]
             
-            if not current.verify_integrity():
+            if not current.verify_integrity(full=full):
                 print(f"❌ Block #{i} has invalid hash!")
                 return False
             
@@ -82,6 +103,18 @@ class Blockchain:
         
         return True
     
+    def is_chain_valid(self, full: bool = False) -> bool:
+        # The chain is append-only, so a verified prefix stays verified;
+        # only the unverified tail is checked unless a full audit is asked for.
+        lo = 1 if full else self._validated_up_to + 1
+        tip = len(self.chain) - 1
+        
+        if not self._verify_range(lo, tip, full=full):
+            return False
+        
+        self._validated_up_to = tip
+        return True
+    
     def get_chain(self) -> List[Dict]:
         return [block.to_dict() for block in self.chain]
     
@@ -91,17 +124,13 @@ class Blockchain:
         return None
     
     def get_transaction(self, tx_id: str) -> Optional[Transaction]:
-        for block in self.chain:
-            for tx in block.transactions:
-                if tx.id == tx_id:
-                    return tx
-        return None
+        entry = self.tx_index.get(tx_id)
+        return entry[1] if entry else None
     
     def get_stats(self) -> Dict[str, Any]:
-        total_txs = sum(len(block.transactions) for block in self.chain)
         return {
             "length": len(self.chain),
-            "total_transactions": total_txs,
+            "total_transactions": self.total_txs,
             "mempool_size": self.mempool.size(),
             "is_valid": self.is_chain_valid()
         }
@@ -1,12 +1,19 @@
-from typing import List, Optional, Dict, Any
+import heapq
+import itertools
+import numpy as np
+from typing import List, Optional, Dict, Any, Tuple
 from core.transaction import Transaction
-from config import PriorityConfig
+from utils import scoring
 
 class Mempool:
     
     def __init__(self):
-        self.transactions: List[Transaction] = []
+        self.transactions: List[Tuple[float, int, Transaction]] = []
         self.tx_by_id: Dict[str, Transaction] = {}
+        # Sequence number of each id's live heap entry
+        self._live_seq: Dict[str, int] = {}
+        self.removed: int = 0
+        self._seq = itertools.count()
         
     def calculate_priority(self, tx: Transaction) -> float:
         
@@ -14,29 +21,45 @@ class Mempool:
         urgency = tx.data.get('urgency', 0.5)
         risk = tx.data.get('risk', 0.5)
         
-        resource_avail = 0.8 
+        return scoring.priority(severity, urgency, risk)
+    
+    def calculate_priorities(self, txs: List[Transaction]) -> List[float]:
         
-        alpha = PriorityConfig.ALPHA
-        beta = PriorityConfig.BETA
-        gamma = PriorityConfig.GAMMA
-        delta = PriorityConfig.DELTA
-
-        priority = (
-            alpha * severity + 
-            beta * urgency + 
-            gamma * resource_avail + 
-            delta * risk
-        )
-
-        return max(0.0, min(1.0, priority))
+        count = len(txs)
+        if count < scoring.BATCH_MIN_SIZE:
+            return [
+                scoring.priority(tx.data.get('severity', 0.5), tx.data.get('urgency', 0.5), tx.data.get('risk', 0.5))
+                for tx in txs
+            ]
+        
+        severity = np.fromiter((tx.data.get('severity', 0.5) for tx in txs), dtype=np.float64, count=count)
+        urgency = np.fromiter((tx.data.get('urgency', 0.5) for tx in txs), dtype=np.float64, count=count)
+        risk = np.fromiter((tx.data.get('risk', 0.5) for tx in txs), dtype=np.float64, count=count)
+        
+        return scoring.priorities(severity, urgency, risk).tolist()
+    
+    def _is_live(self, seq: int, tx: Transaction) -> bool:
+        # Heap entries are deleted lazily: an entry is stale once its id no
+        # longer maps to that entry's sequence number. Comparing objects is
+        # not enough, since a removed transaction can be added back.
+        return self._live_seq.get(tx.id) == seq
+    
+    def _entry(self, tx: Transaction) -> Tuple[float, int, Transaction]:
+        # New heap entry for tx; it becomes the id's only live entry
+        seq = next(self._seq)
+        self._live_seq[tx.id] = seq
+        return (-tx.priority, seq, tx)
     
     def _sort_by_priority(self):
         
-        for tx in self.transactions:
+        live = [tx for _, seq, tx in self.transactions if self._is_live(seq, tx)]
+        for tx in live:
             if not hasattr(tx, 'priority'):
                 tx.priority = self.calculate_priority(tx)
 
-        self.transactions.sort(key=lambda tx: tx.priority, reverse=True)
+        self.transactions = [self._entry(tx) for tx in live]
+        heapq.heapify(self.transactions)
+        self.removed = 0
         
     def add_transaction(self, tx: Transaction) -> bool:
         tx_id = tx.id
@@ -45,43 +68,70 @@ class Mempool:
             return False
         
         tx.priority = self.calculate_priority(tx)
-        self.transactions.append(tx)
-        self.transactions.sort(key=lambda x: x.priority, reverse=True)
+        heapq.heappush(self.transactions, self._entry(tx))
         
         self.tx_by_id[tx_id] = tx
         
         return True
+    
+    def add_transactions(self, txs: List[Transaction]) -> int:
         
-    def get_transactions(self, count: int = 10) -> List[Transaction]:
+        new_txs = []
+        for tx in txs:
+            if tx.id not in self.tx_by_id:
+                self.tx_by_id[tx.id] = tx
+                new_txs.append(tx)
+        
+        if not new_txs:
+            return 0
         
-        top_txs = self.transactions[:count]
+        for tx, priority in zip(new_txs, self.calculate_priorities(new_txs)):
+            tx.priority = priority
+            self.transactions.append(self._entry(tx))
         
-        self.transactions = self.transactions[count:]
+        heapq.heapify(self.transactions)
         
-        for tx in top_txs:
-            del self.tx_by_id[tx.id]
+        return len(new_txs)
+        
+    def get_transactions(self, count: int = 10) -> List[Transaction]:
+        
+        top_txs = []
+        
+        while self.transactions and len(top_txs) < count:
+            _, seq, tx = heapq.heappop(self.transactions)
+            
+            if not self._is_live(seq, tx):
+                self.removed -= 1
+                continue
+            
+            self._forget(tx)
+            top_txs.append(tx)
             
         return top_txs
     
+    def _forget(self, tx: Transaction):
+        del self.tx_by_id[tx.id]
+        del self._live_seq[tx.id]
+    
     def peek_transactions(self, count: int = 10) -> List[Transaction]:
         
-        return self.transactions[:count]
+        entries = heapq.nsmallest(count + self.removed, self.transactions)
+        
+        return [tx for _, seq, tx in entries if self._is_live(seq, tx)][:count]
         
     def remove_transaction(self, tx_id: str) -> bool:
         
         if tx_id not in self.tx_by_id:
             return False
-            
-        tx_to_remove = self.tx_by_id[tx_id]
         
-        del self.tx_by_id[tx_id]
+        self._forget(self.tx_by_id[tx_id])
         
-        self.transactions.remove(tx_to_remove)
+        self.removed += 1
 
         return True
         
     def size(self) -> int:
-        return len(self.transactions)
+        return len(self.transactions) - self.removed
         
     def get_transaction(self, tx_id: str) -> Optional[Transaction]:
         return self.tx_by_id.get(tx_id)
@@ -89,6 +139,8 @@ class Mempool:
     def clear(self):
         self.transactions.clear()
         self.tx_by_id.clear()
+        self._live_seq.clear()
+        self.removed = 0
         
     def get_stats(self) -> Dict[str, Any]:
         stats = {
@@ -98,16 +150,15 @@ class Mempool:
             "min_priority": 0.0
         }
         
-        if not self.transactions:
+        if not self.tx_by_id:
             return stats
             
-        priorities = [tx.priority for tx in self.transactions if hasattr(tx, 'priority')]
+        priorities = [tx.priority for tx in self.tx_by_id.values()]
         
-        if priorities:
-            stats["size"] = len(self.transactions)
-            stats["avg_priority"] = round(sum(priorities) / len(priorities), 3)
-            stats["max_priority"] = round(max(priorities), 3)
-            stats["min_priority"] = round(min(priorities), 3)
+        stats["size"] = len(priorities)
+        stats["avg_priority"] = round(sum(priorities) / len(priorities), 3)
+        stats["max_priority"] = round(max(priorities), 3)
+        stats["min_priority"] = round(min(priorities), 3)
             
         return stats
         
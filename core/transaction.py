@@ -1,39 +1,89 @@
 import time
-import json
+import struct
+from operator import attrgetter
 from typing import Dict, Optional, Any
-from utils.crypto import sha256_hash, sign_message, verify_signature
+from utils.crypto import sha256_bytes, sign_message, verify_signature
+from utils.serialization import canonical_dumps
+
+def _field(value: bytes) -> bytes:
+    return struct.pack('>I', len(value)) + value
+
+def _number(value) -> bytes:
+    # repr is exact for ints of any size and round-trips floats, and keeps
+    # 100 and 100.0 distinct; fixed-width packing would do neither
+    return _field(repr(value).encode('ascii'))
+
+def _signed_field(name: str, header: bool) -> property:
+    # Assigning a signed field drops the cached dict and signature check,
+    # and for header fields the packed header too. Other attributes
+    # (id, priority) stay plain slots, so writing them costs nothing extra
+    slot = "_" + name
+    
+    def setter(self, value):
+        setattr(self, slot, value)
+        self._dict_cache = None
+        self._signature_ok = None
+        if header:
+            self._header_cache = None
+    
+    return property(attrgetter(slot), setter)
 
 class Transaction:
+    
+    __slots__ = ("_sender", "_recipient", "_amount", "_data", "_timestamp",
+                 "_nonce", "_signature", "id", "priority", "_header_cache", "_dict_cache",
+                 "_signature_ok", "_verified_msg")
+    
+    sender = _signed_field("sender", header=True)
+    recipient = _signed_field("recipient", header=True)
+    amount = _signed_field("amount", header=True)
+    timestamp = _signed_field("timestamp", header=True)
+    nonce = _signed_field("nonce", header=True)
+    # data can also change in place, so it is never cached
+    data = _signed_field("data", header=False)
+    signature = _signed_field("signature", header=False)
+    
     def __init__(self,
                  sender: str,
                  recipient: str,
                  amount: float,
                  data: Optional[Dict[str, Any]]=None,
                  nonce: int=0):
-        self.sender = sender
-        self.recipient = recipient
-        self.amount = amount
-        self.data = data or {}
-        self.timestamp = time.time()
-        self.nonce = nonce
-        self.signature = None 
+        self._header_cache: Optional[bytes] = None
+        self._dict_cache: Optional[Dict] = None
+        self._signature_ok: Optional[bool] = None
+        self._verified_msg: Optional[bytes] = None
+        # Nothing is cached yet, so the slots are filled directly
+        self._sender = sender
+        self._recipient = recipient
+        self._amount = amount
+        self._data = data or {}
+        self._timestamp = time.time()
+        self._nonce = nonce
+        self._signature = None
         self.id = self._calculate_id() 
         self.priority = 0.5
+    
+    def get_message_data(self) -> bytes:
+        """
+        Signed message bytes. The fixed fields are packed once; data is a
+        mutable dict, so it is serialized again on every call.
+        """
+        if self._header_cache is None:
+            self._header_cache = (
+                _number(self.amount) +
+                _number(self.timestamp) +
+                _number(self.nonce) +
+                _field(self.sender.encode('utf-8')) +
+                _field(self.recipient.encode('utf-8'))
+            )
+        return self._header_cache + _field(canonical_dumps(self.data))
         
-    def get_message_data(self) -> str:
-        tx_dict = {
-            "sender" : self.sender,
-            "recipient" : self.recipient,
-            "amount" : self.amount,
-            "data" : self.data,
-            "timestamp" : self.timestamp,
-            "nonce" : self.nonce
-        }
-        return json.dumps(tx_dict, sort_keys=True)
+    def canonical_bytes(self) -> bytes:
+        return self.get_message_data() + _field((self.signature or "").encode('utf-8'))
         
     def _calculate_id(self) -> str:
-        tx_json_string = self.get_message_data()
-        return sha256_hash(tx_json_string) [:16]
+        return sha256_bytes(self.get_message_data())[:16]
 
     def sign(self, private_key: str) -> str:
         message_data = self.get_message_data()
@@ -44,22 +94,31 @@ class Transaction:
     def verify_signature(self) -> bool:
         if not self.signature:
             return False
-            
-        message_data = self.get_message_data()
         
-        return verify_signature(message_data, self.signature, self.sender) 
+        # Mempool admission, block checks and dashboard reruns all ask again.
+        # The answer is reused only while the signature and the exact message
+        # bytes it was checked against are unchanged, which also catches
+        # in-place edits to data
+        message_data = self.get_message_data()
+        if self._signature_ok is None or message_data != self._verified_msg:
+            self._signature_ok = verify_signature(message_data, self.signature, self.sender)
+            self._verified_msg = message_data
+        return self._signature_ok
         
     def to_dict(self) -> Dict:
-        return {
-            "sender" : self.sender,
-            "recipient" : self.recipient,
-            "amount" : self.amount,
-            "data" : self.data,
-            "timestamp" : self.timestamp,
-            "nonce" : self.nonce,
-            "signature" : self.signature,
-            "id" : self.id
-        }
+        """Serializable view of the transaction; shared between calls, so don't mutate it."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "sender" : self.sender,
+                "recipient" : self.recipient,
+                "amount" : self.amount,
+                "data" : self.data,
+                "timestamp" : self.timestamp,
+                "nonce" : self.nonce,
+                "signature" : self.signature,
+                "id" : self.id
+            }
+        return self._dict_cache
         
     def __repr__(self) -> str:
         return f"Transaction(id={self.id[:8]}..., sender={self.sender[:8]}..., recipient={self.recipient[:8]}..., amount={self.amount})"
@@ -1,9 +1,13 @@
 import asyncio
+import itertools
+import random
 import sys
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Callable
 from network.node import NetworkNode
-from consensus.validator import Validator
-from config import Tier, ValidatorConfig
+from consensus.validator import Validator, VALIDATOR_SPECS, build_validators
+from utils.log import get_logger
+
+logger = get_logger("cluster")
 
 class NetworkCluster:
     
@@ -11,25 +15,54 @@ class NetworkCluster:
         self.cluster_name = cluster_name
         self.nodes: Dict[str, NetworkNode] = {}
         self.validators: List[Validator] = []
+        
+        # Iteration order of self.nodes, rebuilt only when membership changes
+        self._nodes_snapshot: Tuple[NetworkNode, ...] = ()
+        
+        # Cluster-wide totals, kept current by the nodes' counter_listener
+        self._total_blocks = 0
+        self._total_txs = 0
+    
+    def add_node(self, node: NetworkNode):
+        """Register a node with the cluster and start tracking its counters."""
+        self.nodes[node.node_id] = node
+        self._nodes_snapshot = tuple(self.nodes.values())
+        
+        blocks, txs = node.get_counters()
+        self._total_blocks += blocks
+        self._total_txs += txs
+        node.counter_listener = self._on_node_counters
+    
+    def remove_node(self, node_id: str) -> Optional[NetworkNode]:
+        """Drop a node from the cluster and stop tracking its counters."""
+        node = self.nodes.pop(node_id, None)
+        if node is None:
+            return None
+        
+        self._nodes_snapshot = tuple(self.nodes.values())
+        
+        node.counter_listener = None
+        blocks, txs = node.get_counters()
+        self._total_blocks -= blocks
+        self._total_txs -= txs
+        return node
+    
+    def _on_node_counters(self, blocks_delta: int, txs_delta: int):
+        self._total_blocks += blocks_delta
+        self._total_txs += txs_delta
     
     def create_validators(self):
         """Create validators for the network."""
         print(f"\n[{self.cluster_name}] Creating validators...\n")
         
-        for i in range(ValidatorConfig.TIER_1_COUNT):
-            v = Validator(f"T1_Node_{i}", 500, Tier.TIER_1)
-            self.validators.append(v)
-            print(f"  ✓ {v}")
-        
-        for i in range(ValidatorConfig.TIER_2_COUNT):
-            v = Validator(f"T2_Node_{i}", 300, Tier.TIER_2)
-            self.validators.append(v)
-            print(f"  ✓ {v}")
+        new = build_validators(
+            (f"{prefix}_Node_{i}", stake, tier)
+            for count, stake, tier, prefix in VALIDATOR_SPECS
+            for i in range(count)
+        )
+        self.validators.extend(new)
         
-        for i in range(ValidatorConfig.TIER_3_COUNT):
-            v = Validator(f"T3_Node_{i}", 100, Tier.TIER_3)
-            self.validators.append(v)
-            print(f"  ✓ {v}")
+        sys.stdout.write("".join(f"  ✓ {v}\n" for v in new))
     
     def create_nodes(self, 
                      base_port: int = 8000,
@@ -40,6 +73,7 @@ class NetworkCluster:
         print(f"\n[{self.cluster_name}] Creating {node_count} nodes...\n")
         
         nodes = []
+        lines = []
         for i, validator in enumerate(self.validators[:node_count]):
             node = NetworkNode(
                 node_id=f"Node_{i}",
@@ -48,69 +82,71 @@ class NetworkCluster:
                 validator=validator
             )
             
-            self.nodes[f"Node_{i}"] = node
+            self.add_node(node)
             nodes.append(node)
-            print(f"  ✓ Node_{i} on port {base_port + i}")
+            lines.append(f"  ✓ Node_{i} on port {base_port + i}\n")
         
+        sys.stdout.write("".join(lines))
         return nodes
     
-    def connect_peers(self):
-        """Connect nodes to each other."""
+    async def connect_peers(self):
+        """Connect nodes to each other, handshaking with all peers concurrently."""
         print(f"\n[{self.cluster_name}] Connecting peers...\n")
         
-        nodes_list = list(self.nodes.values())
-        base_port = 8000
-        
-        for i, node in enumerate(nodes_list):
-            for j, other_node in enumerate(nodes_list):
-                if i != j:
-                    node.add_peer(
-                        peer_id=other_node.node_id,
-                        host=other_node.host,
-                        port=other_node.port,
-                        public_key=other_node.validator.public_key
-                    )
+        nodes_list = self._nodes_snapshot
+        
+        # Resolve each node's peer record once instead of once per pair
+        peer_infos = [
+            (node.node_id, node.host, node.port, node.validator.public_key)
+            for node in nodes_list
+        ]
+        
+        async def connect_one(i: int, node: NetworkNode) -> str:
+            others = list(itertools.chain(peer_infos[:i], peer_infos[i + 1:]))
+            for peer_info in others:
+                node.add_peer(*peer_info)
             
-            print(f"  ✓ {node.node_id} connected to {len(node.peers)} peers")
+            await asyncio.gather(*(node.sync_with_peer(peer_id) for peer_id, *_ in others))
+            return f"  ✓ {node.node_id} connected to {len(node.peers)} peers\n"
+        
+        lines = await asyncio.gather(*(connect_one(i, node) for i, node in enumerate(nodes_list)))
+        sys.stdout.write("".join(lines))
     
     async def run_all_nodes(self):
         """Run all nodes concurrently."""
         print(f"\n[{self.cluster_name}] Starting all nodes...\n")
         
-        tasks = []
-        for node in self.nodes.values():
-            task = asyncio.create_task(node.run())
-            tasks.append(task)
-        
+        # The group cancels every node task if one fails or the run is interrupted
         try:
-            await asyncio.gather(*tasks)
-        except KeyboardInterrupt:
+            async with asyncio.TaskGroup() as tg:
+                for node in self._nodes_snapshot:
+                    tg.create_task(node.run())
+        except asyncio.CancelledError:
             print(f"\n[{self.cluster_name}] Stopping all nodes...")
-            for task in tasks:
-                task.cancel()
+            raise
     
-    async def monitor_nodes(self, interval: int = 5):
+    async def monitor_nodes(self, interval: int = 30):
         """Monitor and print node statistics."""
         print(f"\n[{self.cluster_name}] Starting monitor (interval: {interval}s)...\n")
         
         while True:
             try:
-                print("\n" + "=" * 80)
-                print(f"[{self.cluster_name}] Network Status")
-                print("=" * 80)
+                lines = ["", "=" * 80, f"[{self.cluster_name}] Network Status", "=" * 80]
                 
-                for node in self.nodes.values():
+                for node in self._nodes_snapshot:
                     stats = node.get_stats()
-                    print(f"\n{node}")
+                    lines.append(f"\n{node}")
                     for key, value in stats.items():
                         if key != "node_id":
-                            print(f"  {key}: {value}")
+                            lines.append(f"  {key}: {value}")
                 
-                total_blocks = sum(len(node.blockchain.chain) for node in self.nodes.values())
-                total_txs = sum(node.txs_processed for node in self.nodes.values())
-                print(f"\nCluster: Total blocks={total_blocks}, Total txs={total_txs}")
+                lines.append(f"\nCluster: Total blocks={self._total_blocks}, Total txs={self._total_txs}")
                 
-                await asyncio.sleep(interval)
+                # One record per tick; the log listener thread does the write
+                logger.info("\n".join(lines))
+                
+                # Jitter keeps monitors across machines from polling in lockstep
+                await asyncio.sleep(interval * random.uniform(0.9, 1.1))
             
             except KeyboardInterrupt:
                 break
@@ -123,15 +159,17 @@ class NetworkCluster:
         
         self.create_validators()
         self.create_nodes()
-        self.connect_peers()
+        
+        # Nodes start straight away; peer handshakes overlap with their startup
+        node_task = asyncio.create_task(self.run_all_nodes())
+        await self.connect_peers()
         
         if monitor:
-            node_task = asyncio.create_task(self.run_all_nodes())
-            monitor_task = asyncio.create_task(self.monitor_nodes(interval=5))
+            monitor_task = asyncio.create_task(self.monitor_nodes())
             
             await asyncio.gather(node_task, monitor_task)
         else:
-            await self.run_all_nodes()
+            await node_task
 
 class MultiMachineSetup:
     
@@ -179,7 +217,7 @@ async def run_multi_machine_node(machine_id: int):
             port=config["base_port"] + i,
             validator=validator
         )
-        cluster.nodes[node.node_id] = node
+        cluster.add_node(node)
         nodes.append(node)
     
     for node in nodes:
@@ -187,9 +225,18 @@ async def run_multi_machine_node(machine_id: int):
     
     await cluster.run_all_nodes()
 
+def _loop_factory() -> Optional[Callable[[], asyncio.AbstractEventLoop]]:
+    """Use uvloop when it is installed (it isn't available on Windows)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        machine_id = int(sys.argv[1])
-        asyncio.run(run_multi_machine_node(machine_id))
-    else:
-        asyncio.run(run_single_machine_cluster())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        if len(sys.argv) > 1:
+            machine_id = int(sys.argv[1])
+            runner.run(run_multi_machine_node(machine_id))
+        else:
+            runner.run(run_single_machine_cluster())
@@ -4,19 +4,28 @@ import os
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from datetime import datetime
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TYPE_CHECKING
 import numpy as np
 
+# Plotly is imported inside the pages and chart builders that draw with it,
+# so sessions that never open those pages don't pay for loading it
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+try:
+    import xxhash
+except ImportError:
+    # xxhash is optional; without it Streamlit's own md5 hashing is used
+    xxhash = None
+
 
 from core.blockchain import Blockchain
 from core.transaction import Transaction
-from consensus.validator import Validator
-from network.node import NetworkNode
-from config import Tier, ValidatorConfig, PriorityConfig
+from consensus.validator import ValidatorSet, VALIDATOR_SPECS, build_validators
+from config import ValidatorConfig, PriorityConfig
+from utils import scoring
 
 
 st.set_page_config(
@@ -51,26 +60,157 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+# Topology marker color for each tier, indexed by tier.value - 1
+TIER_COLORS = np.array(["red", "blue", "green"])
+
+# Label for each scoring.priority_classes value
+PRIORITY_CLASS_LABELS = np.array(["🟢 Routine", "🟡 Normal", "🔴 Emergency"])
+
+
+# Numeric table columns are sent as numbers and formatted client-side,
+# rather than pre-formatted into strings before they reach Arrow
+SCORE_FORMAT = st.column_config.NumberColumn(format="%.3f")
+PERCENT_FORMAT = st.column_config.NumberColumn(format="%.1f%%")
+
+
+def write_lines(*lines: str):
+    """Render several markdown lines as one element rather than one st.write each."""
+    st.markdown("\n\n".join(lines))
+
+
+# ===== CHARTS =====
+# Figures are cached on their inputs so reruns with unchanged data reuse
+# the figure instead of going through Plotly again. Growing inputs are
+# passed as arrays: Streamlit hashes an ndarray as one buffer, but walks a
+# tuple element by element (~80 ms for 10k floats)
+def _hash_array(a: np.ndarray):
+    return a.dtype.str, a.shape, xxhash.xxh3_64_intdigest(np.ascontiguousarray(a))
+
+ARRAY_HASH_FUNCS = {np.ndarray: _hash_array} if xxhash is not None else None
+
+def tx_per_block_chart(tx_counts: List[int], x_label: str):
+    """Plain bar chart; Streamlit's built-in Vega-Lite chart is far lighter than a Plotly figure."""
+    st.caption("Transactions per Block")
+    st.bar_chart(
+        pd.DataFrame({"Transaction Count": tx_counts}).rename_axis(x_label),
+        x_label=x_label,
+        y_label="Transaction Count"
+    )
+
+@st.cache_data(hash_funcs=ARRAY_HASH_FUNCS)
+def build_topology_chart(labels: tuple, tiers: np.ndarray) -> "go.Figure":
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    # Add validator nodes, evenly spaced on a circle and colored by tier
+    angles = np.arange(len(labels)) / len(labels) * 2 * 3.14159
+    x_pos = 10 * np.cos(angles)
+    y_pos = 10 * np.sin(angles)
+    colors = TIER_COLORS[tiers].tolist()
+    
+    fig.add_trace(go.Scatter(
+        x=x_pos, y=y_pos,
+        mode='markers+text',
+        text=list(labels),
+        textposition="top center",
+        marker=dict(size=15, color=colors),
+        name="Validators"
+    ))
+    
+    fig.update_layout(
+        title="Network Topology",
+        showlegend=False,
+        hovermode='closest',
+        margin=dict(b=20, l=5, r=5, t=40),
+        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    )
+    
+    return fig
+
+@st.cache_data(hash_funcs=ARRAY_HASH_FUNCS)
+def build_growth_chart(timestamps: np.ndarray) -> "go.Figure":
+    import plotly.graph_objects as go
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=[datetime.fromtimestamp(t) for t in timestamps.tolist()],
+        y=np.arange(len(timestamps)),
+        mode='lines+markers',
+        name='Blocks',
+        fill='tozeroy'
+    ))
+    
+    fig.update_layout(
+        title="Block Growth Timeline",
+        xaxis_title="Time",
+        yaxis_title="Block #",
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@st.cache_resource
+def priority_histogram_spec() -> Dict[str, Any]:
+    """
+    Plotly JSON for the priority histogram, captured once from plotly.express.
+    Only the x values change between reruns, so rendering just drops them into
+    a copy of this spec instead of running px.histogram each time.
+    """
+    import plotly.express as px
+    
+    return px.histogram(
+        x=[0.0],
+        nbins=10,
+        title="Transaction Priority Distribution",
+        labels={"x": "Priority Score", "count": "Count"}
+    ).to_plotly_json()
+
+
+@st.cache_data
+def priority_categories_df() -> pd.DataFrame:
+    """PriorityConfig is constant, so its category table is built once per process."""
+    return pd.DataFrame({
+        "Category": PRIORITY_CLASS_LABELS[::-1],
+        "Priority Range": [
+            f"P > {PriorityConfig.EMERGENCY_THRESHOLD}",
+            f"{PriorityConfig.NORMAL_THRESHOLD} < P ≤ {PriorityConfig.EMERGENCY_THRESHOLD}",
+            f"P ≤ {PriorityConfig.NORMAL_THRESHOLD}"
+        ],
+        "Block Size (txs)": np.array([
+            PriorityConfig.BLOCK_SIZE_EMERGENCY,
+            PriorityConfig.BLOCK_SIZE_NORMAL,
+            PriorityConfig.BLOCK_SIZE_ROUTINE
+        ], dtype=np.int32)
+    })
+
+
 # ===== SESSION STATE =====
+@st.cache_resource
+def load_validator_set() -> ValidatorSet:
+    """
+    Validators are built (keypairs and all) once per process and shared by
+    every session, so a reload keeps the keys earlier transactions were
+    signed with. Pages look them up by id through ValidatorSet.by_id.
+    """
+    return ValidatorSet(build_validators(
+        (f"{prefix}_Validator_{i}", stake, tier)
+        for count, stake, tier, prefix in VALIDATOR_SPECS
+        for i in range(count)
+    ))
+
 if 'blockchain' not in st.session_state:
     st.session_state.blockchain = Blockchain()
-    st.session_state.validators = []
+    # The set's score columns stay current as validators change, so pages
+    # read whole columns instead of walking validator objects
+    st.session_state.validator_set = load_validator_set()
+    st.session_state.validator_pool = st.session_state.validator_set.by_id
+    st.session_state.validators = list(st.session_state.validator_pool.values())
     st.session_state.nodes = []
     st.session_state.transactions_created = 0
     st.session_state.blocks_mined = 0
-    
-    # Create validators
-    for i in range(ValidatorConfig.TIER_1_COUNT):
-        v = Validator(f"T1_Validator_{i}", 500, Tier.TIER_1)
-        st.session_state.validators.append(v)
-    
-    for i in range(ValidatorConfig.TIER_2_COUNT):
-        v = Validator(f"T2_Validator_{i}", 300, Tier.TIER_2)
-        st.session_state.validators.append(v)
-    
-    for i in range(ValidatorConfig.TIER_3_COUNT):
-        v = Validator(f"T3_Validator_{i}", 100, Tier.TIER_3)
-        st.session_state.validators.append(v)
 
 
 # ===== SIDEBAR =====
@@ -101,7 +241,7 @@ if page == "📊 Overview":
         )
     
     with col2:
-        total_txs = sum(len(b.transactions) for b in st.session_state.blockchain.chain)
+        total_txs = st.session_state.blockchain.total_txs
         st.metric("Total Transactions", total_txs)
     
     with col3:
@@ -119,20 +259,9 @@ if page == "📊 Overview":
     # Chain visualization
     st.subheader("📈 Blockchain Growth")
     
-    chain_data = {
-        "Block #": list(range(len(st.session_state.blockchain.chain))),
-        "Transactions": [len(b.transactions) for b in st.session_state.blockchain.chain],
-        "Timestamp": [datetime.fromtimestamp(b.timestamp).strftime("%H:%M:%S") 
-                     for b in st.session_state.blockchain.chain]
-    }
+    tx_counts = [len(b.transactions) for b in st.session_state.blockchain.chain]
     
-    fig = px.bar(
-        x=chain_data["Block #"],
-        y=chain_data["Transactions"],
-        title="Transactions per Block",
-        labels={"x": "Block Number", "y": "Transaction Count"}
-    )
-    st.plotly_chart(fig, use_container_width=True)
+    tx_per_block_chart(tx_counts, "Block Number")
     
     # Latest blocks
     st.subheader("📦 Latest Blocks")
@@ -143,14 +272,18 @@ if page == "📊 Overview":
             col1, col2 = st.columns(2)
             
             with col1:
-                st.write(f"**Index:** {block.index}")
-                st.write(f"**Proposer:** {block.proposer[:16]}...")
-                st.write(f"**Timestamp:** {datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
+                write_lines(
+                    f"**Index:** {block.index}",
+                    f"**Proposer:** {block.proposer[:16]}...",
+                    f"**Timestamp:** {datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S')}"
+                )
             
             with col2:
-                st.write(f"**Hash:** `{block.hash}`")
-                st.write(f"**Previous Hash:** `{block.previous_hash[:16]}...`")
-                st.write(f"**Merkle Root:** `{block.merkle_root[:16]}...`")
+                write_lines(
+                    f"**Hash:** `{block.hash}`",
+                    f"**Previous Hash:** `{block.previous_hash[:16]}...`",
+                    f"**Merkle Root:** `{block.merkle_root[:16]}...`"
+                )
 
 
 # ===== PAGE: TRANSACTIONS =====
@@ -163,38 +296,38 @@ elif page == "💱 Transactions":
         st.subheader("Create New Transaction")
         
         if st.session_state.validators:
-            sender_idx = st.selectbox("Sender", range(len(st.session_state.validators)), 
-                                     format_func=lambda i: st.session_state.validators[i].id)
-            recipient_idx = st.selectbox("Recipient", range(len(st.session_state.validators)),
-                                        format_func=lambda i: st.session_state.validators[i].id)
-            amount = st.number_input("Amount", value=100.0, min_value=0.1)
-            
-            severity = st.slider("Severity (Emergency Level)", 0.0, 1.0, 0.5)
-            urgency = st.slider("Urgency", 0.0, 1.0, 0.5)
-            risk = st.slider("Risk Profile", 0.0, 1.0, 0.5)
-            
-            if st.button("✓ Create & Sign Transaction"):
-                sender = st.session_state.validators[sender_idx]
-                recipient = st.session_state.validators[recipient_idx]
+            with st.form("transaction_form"):
+                pool = st.session_state.validator_pool
+                sender_id = st.selectbox("Sender", list(pool))
+                recipient_id = st.selectbox("Recipient", list(pool))
+                amount = st.number_input("Amount", value=100.0, min_value=0.1)
                 
-                tx = Transaction(
-                    sender=sender.public_key,
-                    recipient=recipient.public_key,
-                    amount=amount,
-                    data={
-                        "severity": severity,
-                        "urgency": urgency,
-                        "risk": risk
-                    }
-                )
+                severity = st.slider("Severity (Emergency Level)", 0.0, 1.0, 0.5)
+                urgency = st.slider("Urgency", 0.0, 1.0, 0.5)
+                risk = st.slider("Risk Profile", 0.0, 1.0, 0.5)
                 
-                tx.sign(sender.private_key)
-                
-                if st.session_state.blockchain.add_transaction(tx):
-                    st.success(f"✓ Transaction created: {tx.id}")
-                    st.session_state.transactions_created += 1
-                else:
-                    st.error("✗ Failed to add transaction")
+                if st.form_submit_button("✓ Create & Sign Transaction"):
+                    sender = pool[sender_id]
+                    recipient = pool[recipient_id]
+                    
+                    tx = Transaction(
+                        sender=sender.public_key,
+                        recipient=recipient.public_key,
+                        amount=amount,
+                        data={
+                            "severity": severity,
+                            "urgency": urgency,
+                            "risk": risk
+                        }
+                    )
+                    
+                    tx.sign(sender.private_key)
+                    
+                    if st.session_state.blockchain.add_transaction(tx):
+                        st.success(f"✓ Transaction created: {tx.id}")
+                        st.session_state.transactions_created += 1
+                    else:
+                        st.error("✗ Failed to add transaction")
     
     with col2:
         st.subheader("Mempool Status")
@@ -209,33 +342,30 @@ elif page == "💱 Transactions":
         # Priority distribution
         st.subheader("Priority Distribution")
         if mempool_stats["size"] > 0:
-            priorities = [tx.priority for tx in st.session_state.blockchain.mempool.transactions]
+            priorities = [tx.priority for tx in st.session_state.blockchain.mempool.tx_by_id.values()]
             
-            fig = px.histogram(
-                x=priorities,
-                nbins=10,
-                title="Transaction Priority Distribution",
-                labels={"x": "Priority Score", "count": "Count"}
-            )
+            # Shallow copies only; the cached spec itself is never modified
+            spec = priority_histogram_spec()
+            fig = {**spec, "data": [{**spec["data"][0], "x": priorities}]}
             st.plotly_chart(fig, use_container_width=True)
     
     # All transactions in mempool
     st.subheader("Pending Transactions")
     
     if st.session_state.blockchain.mempool.size() > 0:
-        tx_data = []
-        for tx in st.session_state.blockchain.mempool.peek_transactions(10):
-            tx_data.append({
-                "ID": tx.id[:8],
-                "From": tx.sender[:8] + "...",
-                "To": tx.recipient[:8] + "...",
-                "Amount": tx.amount,
-                "Priority": f"{tx.priority:.3f}",
-                "Signed": "✓" if tx.signature else "✗"
-            })
+        pending = st.session_state.blockchain.mempool.peek_transactions(10)
+        priorities = np.array([tx.priority for tx in pending], dtype=np.float64)
         
-        df = pd.DataFrame(tx_data)
-        st.dataframe(df, use_container_width=True)
+        df = pd.DataFrame({
+            "ID": [tx.id[:8] for tx in pending],
+            "From": [tx.sender[:8] + "..." for tx in pending],
+            "To": [tx.recipient[:8] + "..." for tx in pending],
+            "Amount": np.array([tx.amount for tx in pending], dtype=np.float64),
+            "Priority": priorities.astype(np.float32),
+            "Class": PRIORITY_CLASS_LABELS[scoring.priority_classes(priorities)],
+            "Signed": np.array([tx.signature is not None for tx in pending])
+        })
+        st.dataframe(df, use_container_width=True, column_config={"Priority": SCORE_FORMAT})
     else:
         st.info("No pending transactions")
 
@@ -250,27 +380,27 @@ elif page == "📦 Blocks":
         st.subheader("Mine New Block")
         
         if st.session_state.validators:
-            proposer_idx = st.selectbox("Proposer (Miner)", 
-                                       range(len(st.session_state.validators)),
-                                       format_func=lambda i: st.session_state.validators[i].id)
-            tx_count = st.slider("Transactions to Include", 1, 10, 5)
-            
-            if st.button("⛏️ Mine Block"):
-                proposer = st.session_state.validators[proposer_idx]
-                
-                block = st.session_state.blockchain.mine_block(
-                    proposer=proposer.public_key,
-                    tx_count=tx_count
-                )
+            with st.form("mine_form"):
+                pool = st.session_state.validator_pool
+                proposer_id = st.selectbox("Proposer (Miner)", list(pool))
+                tx_count = st.slider("Transactions to Include", 1, 10, 5)
                 
-                if block:
-                    if st.session_state.blockchain.add_block(block):
-                        st.success(f"✓ Block #{block.index} mined successfully!")
-                        st.session_state.blocks_mined += 1
+                if st.form_submit_button("⛏️ Mine Block"):
+                    proposer = pool[proposer_id]
+                    
+                    block = st.session_state.blockchain.mine_block(
+                        proposer=proposer.public_key,
+                        tx_count=tx_count
+                    )
+                    
+                    if block:
+                        if st.session_state.blockchain.add_block(block):
+                            st.success(f"✓ Block #{block.index} mined successfully!")
+                            st.session_state.blocks_mined += 1
+                        else:
+                            st.error("✗ Block validation failed")
                     else:
-                        st.error("✗ Block validation failed")
-                else:
-                    st.warning("⚠ No transactions to mine")
+                        st.warning("⚠ No transactions to mine")
     
     with col2:
         st.subheader("Chain Statistics")
@@ -278,7 +408,7 @@ elif page == "📦 Blocks":
         st.metric("Total Blocks", len(st.session_state.blockchain.chain))
         st.metric("Blocks Mined", st.session_state.blocks_mined)
         
-        total_txs = sum(len(b.transactions) for b in st.session_state.blockchain.chain)
+        total_txs = st.session_state.blockchain.total_txs
         st.metric("Total Transactions", total_txs)
         
         avg_txs = total_txs / len(st.session_state.blockchain.chain) if st.session_state.blockchain.chain else 0
@@ -299,35 +429,39 @@ elif page == "📦 Blocks":
             col1, col2, col3 = st.columns(3)
             
             with col1:
-                st.write("**Index:**", block.index)
-                st.write("**Hash:**", f"`{block.hash}`")
-                st.write("**Previous Hash:**", f"`{block.previous_hash[:16]}...`")
+                write_lines(
+                    f"**Index:** {block.index}",
+                    f"**Hash:** `{block.hash}`",
+                    f"**Previous Hash:** `{block.previous_hash[:16]}...`"
+                )
             
             with col2:
-                st.write("**Proposer:**", f"`{block.proposer[:16]}...`")
-                st.write("**Timestamp:**", datetime.fromtimestamp(block.timestamp).strftime("%Y-%m-%d %H:%M:%S"))
-                st.write("**Merkle Root:**", f"`{block.merkle_root[:16]}...`")
+                write_lines(
+                    f"**Proposer:** `{block.proposer[:16]}...`",
+                    f"**Timestamp:** {datetime.fromtimestamp(block.timestamp).strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"**Merkle Root:** `{block.merkle_root[:16]}...`"
+                )
             
             with col3:
                 integrity = block.verify_integrity()
                 txs_valid = block.verify_transactions()
-                st.write("**Integrity:**", "✓ Valid" if integrity else "✗ Invalid")
-                st.write("**Txs Valid:**", "✓ Valid" if txs_valid else "✗ Invalid")
-                st.write("**Transaction Count:**", len(block.transactions))
+                write_lines(
+                    f"**Integrity:** {'✓ Valid' if integrity else '✗ Invalid'}",
+                    f"**Txs Valid:** {'✓ Valid' if txs_valid else '✗ Invalid'}",
+                    f"**Transaction Count:** {len(block.transactions)}"
+                )
             
             # Transactions in block
             st.write("**Transactions in Block:**")
             if block.transactions:
-                tx_data = []
-                for tx in block.transactions:
-                    tx_data.append({
-                        "ID": tx.id[:8],
-                        "From": tx.sender[:8] + "...",
-                        "To": tx.recipient[:8] + "...",
-                        "Amount": tx.amount,
-                        "Signed": "✓" if tx.verify_signature() else "✗"
-                    })
-                df = pd.DataFrame(tx_data)
+                txs = block.transactions
+                df = pd.DataFrame({
+                    "ID": [tx.id[:8] for tx in txs],
+                    "From": [tx.sender[:8] + "..." for tx in txs],
+                    "To": [tx.recipient[:8] + "..." for tx in txs],
+                    "Amount": np.array([tx.amount for tx in txs], dtype=np.float64),
+                    "Signed": np.array([tx.verify_signature() for tx in txs])
+                })
                 st.dataframe(df, use_container_width=True)
             else:
                 st.write("Genesis block (no transactions)")
@@ -337,8 +471,10 @@ elif page == "📦 Blocks":
 elif page == "✅ Validators":
     st.title("✅ Validator Management")
     
+    vset = st.session_state.validator_set
+    
     # Validator tier breakdown
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Tier-1 (Emergency)", ValidatorConfig.TIER_1_COUNT)
@@ -346,38 +482,43 @@ elif page == "✅ Validators":
         st.metric("Tier-2 (Standard)", ValidatorConfig.TIER_2_COUNT)
     with col3:
         st.metric("Tier-3 (Audit)", ValidatorConfig.TIER_3_COUNT)
+    with col4:
+        st.metric("Avg Reputation", f"{vset.mean_reputation:.3f}")
     
     # Validator table
     st.subheader("Validator Details")
     
-    validator_data = []
-    for v in st.session_state.validators:
-        v_score = v.calculate_v_score()
-        validator_data.append({
-            "ID": v.id,
-            "Tier": v.tier.name,
-            "Stake": v.stake,
-            "Reputation": f"{v.reputation:.3f}",
-            "V-Score": f"{v_score:.3f}",
-            "Blocks Validated": v.blocks_validated,
-            "Uptime": f"{v.uptime*100:.1f}%",
-            "Public Key": v.public_key[:8] + "..."
-        })
-    
-    df = pd.DataFrame(validator_data)
-    st.dataframe(df, use_container_width=True)
+    ids = [v.id for v in vset.validators]
+    v_scores = vset.v_scores()
+    reputations = vset.reputations
+    
+    df = pd.DataFrame({
+        "ID": ids,
+        "Tier": [v.tier.name for v in vset.validators],
+        "Stake": np.array([v.stake for v in vset.validators], dtype=np.float32),
+        "Reputation": reputations.astype(np.float32),
+        "V-Score": v_scores.astype(np.float32),
+        "Blocks Validated": np.array([v.blocks_validated for v in vset.validators], dtype=np.int32),
+        "Uptime": (vset.uptimes * 100).astype(np.float32),
+        "Public Key": [v.public_key[:8] + "..." for v in vset.validators]
+    })
+    st.dataframe(df, use_container_width=True, column_config={
+        "Reputation": SCORE_FORMAT,
+        "V-Score": SCORE_FORMAT,
+        "Uptime": PERCENT_FORMAT
+    })
     
     # Score breakdown visualization
     st.subheader("Validator Scores Comparison")
     
-    v_scores = {v.id: v.calculate_v_score() for v in st.session_state.validators}
+    import plotly.express as px
     
     fig = px.bar(
-        x=list(v_scores.keys()),
-        y=list(v_scores.values()),
+        x=ids,
+        y=v_scores,
         title="Validator Scores (Higher = More Influence)",
         labels={"x": "Validator", "y": "V-Score"},
-        color=list(v_scores.values()),
+        color=v_scores,
         color_continuous_scale="Viridis"
     )
     st.plotly_chart(fig, use_container_width=True)
@@ -385,14 +526,12 @@ elif page == "✅ Validators":
     # Reputation tracker
     st.subheader("Reputation Trends")
     
-    reputations = {v.id: v.reputation for v in st.session_state.validators}
-    
     fig = px.bar(
-        x=list(reputations.keys()),
-        y=list(reputations.values()),
+        x=ids,
+        y=reputations,
         title="Validator Reputation",
         labels={"x": "Validator", "y": "Reputation"},
-        color=list(reputations.values()),
+        color=reputations,
         color_continuous_scale="RdYlGn"
     )
     st.plotly_chart(fig, use_container_width=True)
@@ -414,46 +553,10 @@ elif page == "🌐 Network":
     # Network visualization
     st.subheader("Network Topology")
     
-    fig = go.Figure()
-    
-    # Add validator nodes
-    x_pos = []
-    y_pos = []
-    labels = []
-    colors = []
-    
-    for i, v in enumerate(st.session_state.validators):
-        angle = (i / len(st.session_state.validators)) * 2 * 3.14159
-        x = 10 * np.cos(angle)
-        y = 10 * np.sin(angle)
-        
-        x_pos.append(x)
-        y_pos.append(y)
-        labels.append(v.id)
-        
-        if v.tier == Tier.TIER_1:
-            colors.append("red")
-        elif v.tier == Tier.TIER_2:
-            colors.append("blue")
-        else:
-            colors.append("green")
-    
-    fig.add_trace(go.Scatter(
-        x=x_pos, y=y_pos,
-        mode='markers+text',
-        text=labels,
-        textposition="top center",
-        marker=dict(size=15, color=colors),
-        name="Validators"
-    ))
-    
-    fig.update_layout(
-        title="Network Topology",
-        showlegend=False,
-        hovermode='closest',
-        margin=dict(b=20, l=5, r=5, t=40),
-        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    validators = st.session_state.validators
+    fig = build_topology_chart(
+        tuple(v.id for v in validators),
+        np.fromiter((v.tier.value - 1 for v in validators), dtype=np.intp, count=len(validators))
     )
     
     st.plotly_chart(fig, use_container_width=True)
@@ -465,7 +568,7 @@ elif page == "🌐 Network":
         "Metric": ["Total Blocks", "Total Transactions", "Pending Transactions", "Chain Valid"],
         "Value": [
             len(st.session_state.blockchain.chain),
-            sum(len(b.transactions) for b in st.session_state.blockchain.chain),
+            st.session_state.blockchain.total_txs,
             st.session_state.blockchain.mempool.size(),
             "✓ Yes" if st.session_state.blockchain.is_chain_valid() else "✗ No"
         ]
@@ -508,32 +611,17 @@ elif page == "⚙️ Consensus":
     
     st.write(f"**Priority Formula:** P(tx) = α·severity + β·urgency + γ·resources + δ·risk")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("α (Severity)", PriorityConfig.ALPHA)
-    with col2:
-        st.metric("β (Urgency)", PriorityConfig.BETA)
-    with col3:
-        st.metric("γ (Resources)", PriorityConfig.GAMMA)
-    with col4:
-        st.metric("δ (Risk)", PriorityConfig.DELTA)
+    # One table row rather than four separate metric elements
+    st.dataframe(pd.DataFrame({
+        "α (Severity)": [PriorityConfig.ALPHA],
+        "β (Urgency)": [PriorityConfig.BETA],
+        "γ (Resources)": [PriorityConfig.GAMMA],
+        "δ (Risk)": [PriorityConfig.DELTA]
+    }), use_container_width=True, hide_index=True)
     
     # Priority categories
     st.write("**Priority Categories:**")
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.write(f"🔴 **Emergency**: P > {PriorityConfig.EMERGENCY_THRESHOLD}")
-        st.write(f"Block Size: {PriorityConfig.BLOCK_SIZE_EMERGENCY} txs")
-    
-    with col2:
-        st.write(f"🟡 **Normal**: {PriorityConfig.NORMAL_THRESHOLD} < P ≤ {PriorityConfig.EMERGENCY_THRESHOLD}")
-        st.write(f"Block Size: {PriorityConfig.BLOCK_SIZE_NORMAL} txs")
-    
-    with col3:
-        st.write(f"🟢 **Routine**: P ≤ {PriorityConfig.NORMAL_THRESHOLD}")
-        st.write(f"Block Size: {PriorityConfig.BLOCK_SIZE_ROUTINE} txs")
+    st.dataframe(priority_categories_df(), use_container_width=True, hide_index=True)
     
     # Consensus flow diagram
     st.subheader("Consensus Flow")
@@ -559,78 +647,60 @@ elif page == "📈 Analytics":
     # Performance metrics
     st.subheader("Performance Metrics")
     
-    col1, col2, col3, col4 = st.columns(4)
-    
-    total_txs = sum(len(b.transactions) for b in st.session_state.blockchain.chain)
+    total_txs = st.session_state.blockchain.total_txs
     blocks_count = len(st.session_state.blockchain.chain)
-    
-    with col1:
-        st.metric("Total Blocks", blocks_count)
-    with col2:
-        st.metric("Total Transactions", total_txs)
-    with col3:
-        avg_block_time = (st.session_state.blockchain.chain[-1].timestamp - 
-                         st.session_state.blockchain.chain[0].timestamp) / (blocks_count - 1) if blocks_count > 1 else 0
-        st.metric("Avg Block Time", f"{avg_block_time:.1f}s")
-    with col4:
-        tps = total_txs / (st.session_state.blockchain.chain[-1].timestamp - 
-                          st.session_state.blockchain.chain[0].timestamp + 1)
-        st.metric("TPS", f"{tps:.2f}")
+    span = st.session_state.blockchain.chain[-1].timestamp - st.session_state.blockchain.chain[0].timestamp
+    avg_block_time = span / (blocks_count - 1) if blocks_count > 1 else 0.0
+    tps = total_txs / (span + 1)
+    
+    # One table row rather than four separate metric elements
+    st.dataframe(pd.DataFrame({
+        "Total Blocks": [blocks_count],
+        "Total Transactions": [total_txs],
+        "Avg Block Time": [avg_block_time],
+        "TPS": [tps]
+    }), use_container_width=True, hide_index=True, column_config={
+        "Avg Block Time": st.column_config.NumberColumn(format="%.1f s"),
+        "TPS": st.column_config.NumberColumn(format="%.2f")
+    })
     
     # Blockchain growth
     st.subheader("Blockchain Growth Over Time")
     
-    block_times = [datetime.fromtimestamp(b.timestamp) for b in st.session_state.blockchain.chain]
-    block_indices = list(range(len(st.session_state.blockchain.chain)))
-    tx_counts = [len(b.transactions) for b in st.session_state.blockchain.chain]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=block_times,
-        y=block_indices,
-        mode='lines+markers',
-        name='Blocks',
-        fill='tozeroy'
-    ))
-    
-    fig.update_layout(
-        title="Block Growth Timeline",
-        xaxis_title="Time",
-        yaxis_title="Block #",
-        hovermode='x unified'
-    )
+    chain = st.session_state.blockchain.chain
+    fig = build_growth_chart(np.fromiter((b.timestamp for b in chain), dtype=np.float64, count=len(chain)))
     
     st.plotly_chart(fig, use_container_width=True)
     
     # Transaction distribution
     st.subheader("Transaction Distribution Across Blocks")
     
-    fig = px.bar(
-        x=block_indices,
-        y=tx_counts,
-        title="Transactions per Block",
-        labels={"x": "Block #", "y": "Transaction Count"}
-    )
-    
-    st.plotly_chart(fig, use_container_width=True)
+    tx_per_block_chart([len(b.transactions) for b in chain], "Block #")
     
     # Validator performance
     st.subheader("Validator Performance")
     
-    perf_data = []
-    for v in st.session_state.validators:
-        win_rate = (v.correct_votes / (v.blocks_validated + 1)) * 100
-        perf_data.append({
-            "Validator": v.id,
-            "Score": v.calculate_v_score(),
-            "Reputation": v.reputation,
-            "Win Rate": win_rate,
-            "Uptime": v.uptime * 100
-        })
+    vset = st.session_state.validator_set
+    n = len(vset)
+    correct_votes = np.fromiter((v.correct_votes for v in vset.validators), dtype=np.float64, count=n)
+    blocks_validated = np.fromiter((v.blocks_validated for v in vset.validators), dtype=np.float64, count=n)
+    
+    perf_data = {
+        "Validator": [v.id for v in vset.validators],
+        "Score": vset.v_scores().astype(np.float32),
+        "Reputation": vset.reputations.astype(np.float32),
+        "Win Rate": (correct_votes / (blocks_validated + 1) * 100).astype(np.float32),
+        "Uptime": (vset.uptimes * 100).astype(np.float32)
+    }
+    perf_columns = {
+        "Score": SCORE_FORMAT,
+        "Reputation": SCORE_FORMAT,
+        "Win Rate": PERCENT_FORMAT,
+        "Uptime": PERCENT_FORMAT
+    }
     
     df = pd.DataFrame(perf_data)
-    st.dataframe(df, use_container_width=True)
+    st.dataframe(df, use_container_width=True, column_config=perf_columns)
     
     # Export options
     st.subheader("Export Data")
@@ -641,12 +711,9 @@ elif page == "📈 Analytics":
     
     if st.button("📥 Export Validators to CSV"):
         df = pd.DataFrame(perf_data)
-        st.dataframe(df)
+        st.dataframe(df, column_config=perf_columns)
 
 
-# Import numpy for network visualization
-import numpy as np
-
 # Footer
 st.markdown("---")
 st.markdown("""
@@ -1,8 +1,8 @@
 from core.blockchain import Blockchain
 from core.transaction import Transaction
 from core.block import Block
-from consensus.validator import Validator
-from config import Tier, ValidatorConfig, PriorityConfig
+from consensus.validator import VALIDATOR_SPECS, build_validators
+from config import PriorityConfig
 import time
 
 def demo_blockchain():
@@ -13,21 +13,13 @@ def demo_blockchain():
     
     print("\n[1] Creating validators...\n")
     
-    validators = []
+    validators = build_validators(
+        (f"Validator_{prefix}_{i}", stake, tier)
+        for count, stake, tier, prefix in VALIDATOR_SPECS
+        for i in range(count)
+    )
     
-    for i in range(ValidatorConfig.TIER_1_COUNT):
-        v = Validator(f"Validator_T1_{i}", 500, Tier.TIER_1)
-        validators.append(v)
-        print(f"  ✓ {v}")
-    
-    for i in range(ValidatorConfig.TIER_2_COUNT):
-        v = Validator(f"Validator_T2_{i}", 300, Tier.TIER_2)
-        validators.append(v)
-        print(f"  ✓ {v}")
-    
-    for i in range(ValidatorConfig.TIER_3_COUNT):
-        v = Validator(f"Validator_T3_{i}", 100, Tier.TIER_3)
-        validators.append(v)
+    for v in validators:
         print(f"  ✓ {v}")
     
     print("\n[2] Creating blockchain...\n")
@@ -119,7 +111,7 @@ def demo_blockchain():
     original_hash = blockchain.chain[1].hash
     blockchain.chain[1].transactions[0].amount = 999999
     
-    new_hash = blockchain.chain[1]._calculate_hash()
+    new_hash = blockchain.chain[1]._calculate_hash(blockchain.chain[1]._calculate_merkle_root())
     
     print(f"  Original hash: {original_hash[:16]}...")
     print(f"  After tampering: {new_hash[:16]}...")
@@ -1,13 +1,14 @@
 import asyncio
 import json
 import time
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Tuple
 from dataclasses import dataclass
 from core.blockchain import Blockchain
 from core.transaction import Transaction
 from core.block import Block
 from consensus.validator import Validator
 from consensus.pbft import PBFTConsensus
+from utils import scoring
 from config import NetworkConfig, ValidatorConfig
 
 @dataclass
@@ -34,14 +35,34 @@ class NetworkNode:
         self.pbft: Optional[PBFTConsensus] = None
         
         self.peers: Dict[str, PeerInfo] = {}
-        self.message_queue: asyncio.Queue = asyncio.Queue()
+        # Number of peers with is_connected set, kept current as peers connect
+        self.peers_connected = 0
+        # Outgoing messages; bounded, since nothing delivers them yet
+        self.message_queue: asyncio.Queue = asyncio.Queue(maxsize=NetworkConfig.OUTBOX_MAX)
+        
+        # Proposed blocks awaiting consensus, oldest first, at most
+        # PIPELINE_DEPTH at a time; _tip is the newest one to build on
+        self._in_flight: asyncio.Queue = asyncio.Queue()
+        self._window = asyncio.Semaphore(NetworkConfig.PIPELINE_DEPTH)
+        self._tip: Optional[Block] = None
+        
+        # Transactions waiting to go out in the next TX_BATCH message
+        self._tx_batch: List[Transaction] = []
+        self._batch_event = asyncio.Event()
         
         self.blocks_mined = 0
         self.txs_processed = 0
         self.start_time = time.time()
+        
+        # Called as counter_listener(blocks_delta, txs_delta) when counters change
+        self.counter_listener: Optional[Callable[[int, int], None]] = None
     
     def add_peer(self, peer_id: str, host: str, port: int, public_key: str):
         """Register a peer node."""
+        old = self.peers.get(peer_id)
+        if old is not None and old.is_connected:
+            self.peers_connected -= 1
+        
         self.peers[peer_id] = PeerInfo(
             node_id=peer_id,
             host=host,
@@ -59,18 +80,32 @@ class NetworkNode:
         self.pbft = PBFTConsensus(self.validator, validators)
     
     async def broadcast_transaction(self, tx: Transaction):
-        """Broadcast transaction to all peers."""
-        msg = {
-            "type": "TRANSACTION",
-            "tx": tx.to_dict(),
-            "from": self.node_id
-        }
-        
+        """Broadcast transaction to all peers (sent with the next TX_BATCH)."""
         print(f"[{self.node_id}] Broadcasting transaction: {tx.id}")
         
         self.blockchain.add_transaction(tx)
         
-        await self.message_queue.put(msg)
+        self._tx_batch.append(tx)
+        self._batch_event.set()
+    
+    async def _run_batcher(self):
+        """Coalesce pending broadcast_transaction calls into TX_BATCH messages."""
+        while True:
+            await self._batch_event.wait()
+            await asyncio.sleep(NetworkConfig.TX_BATCH_DELAY)
+            
+            batch = self._tx_batch[:NetworkConfig.TX_BATCH_MAX]
+            del self._tx_batch[:NetworkConfig.TX_BATCH_MAX]
+            if not self._tx_batch:
+                self._batch_event.clear()
+            
+            msg = {
+                "type": "TX_BATCH",
+                "txs": [tx.to_dict() for tx in batch],
+                "from": self.node_id
+            }
+            
+            self._enqueue(msg)
     
     async def propose_block(self) -> Optional[Block]:
         """Propose new block for consensus."""
@@ -78,7 +113,8 @@ class NetworkNode:
         
         block = self.blockchain.mine_block(
             proposer=self.validator.public_key,
-            tx_count=5
+            tx_count=5,
+            parent=self._tip
         )
         
         if not block:
@@ -98,15 +134,77 @@ class NetworkNode:
         
         if self.pbft:
             success = await self.pbft.run_consensus(block)
+            await self._finalize_block(block, success)
+    
+    async def pipelined_round(self):
+        """
+        Propose a block and start its consensus without waiting for the result.
+        
+        Waits only while PIPELINE_DEPTH rounds are already undecided;
+        _run_committer applies the outcomes in proposal order.
+        """
+        await self._window.acquire()
+        
+        block = await self.propose_block()
+        
+        if not block or not self.pbft:
+            self._window.release()
+            if not block:
+                await asyncio.sleep(1)
+            return
+        
+        self._tip = block
+        task = asyncio.create_task(self.pbft.run_consensus(block))
+        self._in_flight.put_nowait((block, task))
+    
+    async def _run_committer(self):
+        """Apply pipelined consensus results to the chain, in proposal order."""
+        while True:
+            block, task = await self._in_flight.get()
+            try:
+                try:
+                    success = await task
+                except Exception as e:
+                    print(f"[{self.node_id}] ✗ Consensus for block #{block.index} failed: {e!r}")
+                    success = False
+                await self._finalize_block(block, success)
+            except Exception as e:
+                # Keep committing later rounds; a dead committer would leave
+                # pipelined_round waiting on the window forever
+                print(f"[{self.node_id}] ✗ Could not finalize block #{block.index}: {e!r}")
+            finally:
+                self._window.release()
+    
+    async def _finalize_block(self, block: Block, success: bool):
+        if success:
+            if self.blockchain.add_block(block):
+                self.blocks_mined += 1
+                if self.counter_listener:
+                    self.counter_listener(1, 0)
+                print(f"[{self.node_id}] ✓ Block #{block.index} added to chain")
+                
+                await self.broadcast_block(block)
+                return
             
-            if success:
-                if self.blockchain.add_block(block):
-                    self.blocks_mined += 1
-                    print(f"[{self.node_id}] ✓ Block #{block.index} added to chain")
-                    
-                    await self.broadcast_block(block)
-                else:
-                    print(f"[{self.node_id}] ✗ Block rejected")
+            print(f"[{self.node_id}] ✗ Block rejected")
+        
+        # Every block still in flight was proposed on top of this one and
+        # would be rejected in turn; abandon them, return all their
+        # transactions to the mempool and build on the chain tip again
+        txs = list(block.transactions)
+        txs.extend(self._abandon_in_flight())
+        self.blockchain.mempool.add_transactions(txs)
+        self._tip = None
+    
+    def _abandon_in_flight(self) -> List[Transaction]:
+        """Cancel undecided rounds and return the transactions they carried."""
+        txs: List[Transaction] = []
+        while not self._in_flight.empty():
+            block, task = self._in_flight.get_nowait()
+            task.cancel()
+            txs.extend(block.transactions)
+            self._window.release()
+        return txs
     
     async def broadcast_block(self, block: Block):
         """Broadcast finalized block to peers."""
@@ -118,7 +216,13 @@ class NetworkNode:
         
         print(f"[{self.node_id}] Broadcasting block #{block.index}")
         
-        await self.message_queue.put(msg)
+        self._enqueue(msg)
+    
+    def _enqueue(self, msg: Dict[str, Any]):
+        """Queue an outgoing message, dropping the oldest one if the queue is full."""
+        if self.message_queue.full():
+            self.message_queue.get_nowait()
+        self.message_queue.put_nowait(msg)
     
     async def sync_with_peer(self, peer_id: str):
         """Sync blockchain state with a peer."""
@@ -128,7 +232,9 @@ class NetworkNode:
         peer = self.peers[peer_id]
         print(f"[{self.node_id}] Syncing with {peer_id} at {peer.host}:{peer.port}")
         
-        peer.is_connected = True
+        if not peer.is_connected:
+            peer.is_connected = True
+            self.peers_connected += 1
         peer.last_heartbeat = time.time()
     
     async def handle_message(self, msg: Dict[str, Any]):
@@ -139,6 +245,15 @@ class NetworkNode:
             tx_dict = msg.get("tx")
             print(f"[{self.node_id}] Received transaction from {msg.get('from')}")
             self.txs_processed += 1
+            if self.counter_listener:
+                self.counter_listener(0, 1)
+        
+        elif msg_type == "TX_BATCH":
+            txs = msg.get("txs", [])
+            print(f"[{self.node_id}] Received {len(txs)} transactions from {msg.get('from')}")
+            self.txs_processed += len(txs)
+            if self.counter_listener:
+                self.counter_listener(0, len(txs))
         
         elif msg_type == "BLOCK":
             block_dict = msg.get("block")
@@ -154,14 +269,40 @@ class NetworkNode:
         print(f"[{self.node_id}] Public key: {self.validator.public_key[:16]}...")
         
         await self.init_consensus()
+        # Load the priority kernel before any round runs, rather than on
+        # the loop the first time a failed round requeues transactions
+        scoring.warm_up()
+        batcher = asyncio.create_task(self._run_batcher())
+        committer = asyncio.create_task(self._run_committer())
+        round_task: Optional[asyncio.Task] = None
         
         try:
             while True:
-                await self.consensus_round()
+                round_task = asyncio.create_task(self.pipelined_round())
+                await asyncio.wait((round_task, committer), return_when=asyncio.FIRST_COMPLETED)
+                if committer.done():
+                    # Surface whatever stopped the committer instead of
+                    # waiting for a window slot that will never be released
+                    committer.result()
+                    raise RuntimeError(f"[{self.node_id}] committer exited")
+                round_task.result()
                 await asyncio.sleep(2)
         
         except KeyboardInterrupt:
             print(f"\n[{self.node_id}] Shutting down...")
+        
+        finally:
+            if round_task is not None:
+                round_task.cancel()
+            batcher.cancel()
+            committer.cancel()
+            while not self._in_flight.empty():
+                _, task = self._in_flight.get_nowait()
+                task.cancel()
+    
+    def get_counters(self) -> Tuple[int, int]:
+        """Get (chain_length, txs_processed) without building the stats dict."""
+        return len(self.blockchain.chain), self.txs_processed
     
     def get_stats(self) -> Dict[str, Any]:
         """Get node statistics."""
@@ -176,7 +317,7 @@ class NetworkNode:
             "mempool_size": self.blockchain.mempool.size(),
             "uptime_seconds": round(uptime, 1),
             "validator_score": round(self.validator.calculate_v_score(), 3),
-            "peers_connected": sum(1 for p in self.peers.values() if p.is_connected)
+            "peers_connected": self.peers_connected
         }
     
     def __repr__(self) -> str:
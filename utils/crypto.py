@@ -1,21 +1,56 @@
 import hashlib
-from typing import Tuple
+import functools
+from typing import Tuple, Any
 import os
 import json
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.asymmetric import ed25519
-from cryptography.hazmat.primitives import serialization
+from utils.serialization import canonical_dumps
 
-def sha256_hash(data) -> str:
+# cryptography is loaded on first use so that modules which only need
+# sha256_hash don't pay for the backend; after that the module is cached.
+_ed25519 = None
+
+def _ed25519_backend():
+    global _ed25519
+    if _ed25519 is None:
+        from cryptography.hazmat.primitives.asymmetric import ed25519
+        _ed25519 = ed25519
+    return _ed25519
+
+# Parsed key objects by hex string; signers and senders repeat constantly
+@functools.lru_cache(maxsize=4096)
+def _private_key(private_key_hex: str):
+    return _ed25519_backend().Ed25519PrivateKey.from_private_bytes(bytes.fromhex(private_key_hex))
+
+@functools.lru_cache(maxsize=4096)
+def _public_key(public_key_hex: str):
+    return _ed25519_backend().Ed25519PublicKey.from_public_bytes(bytes.fromhex(public_key_hex))
+
+def encode_for_hash(data) -> bytes:
+    """The bytes sha256_hash digests for a dict, list or other value."""
     if isinstance(data,dict):
         data_string= json.dumps(data, sort_keys=True)
     elif isinstance(data, list):
         data_string= json.dumps(data)
     else:
         data_string=str(data)
-    return hashlib.sha256(data_string.encode('utf-8')).hexdigest()
+    return data_string.encode('utf-8')
+
+def sha256_hash(data) -> str:
+    """Hash any value; prefer sha256_bytes or sha256_json when the type is known."""
+    return hashlib.sha256(encode_for_hash(data)).hexdigest()
+
+def sha256_bytes(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+def sha256_json(obj: Any) -> str:
+    return hashlib.sha256(canonical_dumps(obj)).hexdigest()
+
+def sha256_bin(data: bytes) -> bytes:
+    return hashlib.sha256(data).digest()
 
 def generate_keypair() -> Tuple[str, str]:
+    from cryptography.hazmat.primitives import serialization
+    ed25519 = _ed25519_backend()
     private_key_obj = ed25519.Ed25519PrivateKey.generate()
     public_key_obj = private_key_obj.public_key()
     private_key_bites= private_key_obj.private_bytes(
@@ -31,18 +66,16 @@ def generate_keypair() -> Tuple[str, str]:
     private_key_hex = private_key_bites.hex()
     return (public_key_hex, private_key_hex)
 
-def sign_message(message: str, private_key_hex: str) -> str:
-    private_key_bites = bytes.fromhex(private_key_hex)
-    private_key_obj = ed25519.Ed25519PrivateKey.from_private_bytes(private_key_bites)
-    signature = private_key_obj.sign(message.encode('utf-8'))
+def sign_message(message: bytes, private_key_hex: str) -> str:
+    private_key_obj = _private_key(private_key_hex)
+    signature = private_key_obj.sign(message)
     return signature.hex()
 
-def verify_signature(message: str, signature_hex: str, public_key_hex: str) -> bool:
-    public_key_bites = bytes.fromhex(public_key_hex)
-    public_key_obj = ed25519.Ed25519PublicKey.from_public_bytes(public_key_bites)
+def verify_signature(message: bytes, signature_hex: str, public_key_hex: str) -> bool:
+    public_key_obj = _public_key(public_key_hex)
     signature_bites = bytes.fromhex(signature_hex)
     try:
-        public_key_obj.verify(signature_bites, message.encode('utf-8'))
+        public_key_obj.verify(signature_bites, message)
         return True
     except Exception:
         return False
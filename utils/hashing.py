@@ -1,79 +1,95 @@
+import hashlib
 from typing import List, Union, Dict, Tuple
-from utils.crypto import sha256_hash
+from utils.crypto import sha256_bytes, sha256_bin, encode_for_hash
+
+def _leaf_digest(tx: Union[str, Dict]) -> bytes:
+    return sha256_bin(encode_for_hash(tx))
+
+def _leaf_buffer(digests) -> Tuple[bytearray, int]:
+    """
+    Lay the leaf digests out in one buffer that the whole tree is built in.
+    
+    One spare slot is reserved for duplicating an odd last digest.
+    """
+    level = b''.join(digests)
+    n = len(level) // 32
+    buf = bytearray(n * 32 + 32)
+    buf[:len(level)] = level
+    return buf, n
+
+def _hash_level(view: memoryview, n: int) -> int:
+    """
+    Hash one tree level in place and return the parent level's size.
+    
+    view holds the level's n digests back to back; an odd last digest is
+    paired with itself. Pairs are hashed straight out of the buffer and
+    the parent level is written back over the front of it in one copy.
+    """
+    if n & 1:
+        view[n * 32:n * 32 + 32] = view[(n - 1) * 32:n * 32]
+        n += 1
+    sha256 = hashlib.sha256
+    parents = b''.join([sha256(view[i:i + 64]).digest() for i in range(0, n * 32, 64)])
+    n //= 2
+    view[:n * 32] = parents
+    return n
+
+def _root(buf: bytearray, n: int) -> str:
+    with memoryview(buf) as view:
+        while n > 1:
+            n = _hash_level(view, n)
+        return view[:32].hex()
 
 def merkle_root(transaction: List) -> str:
     if not transaction:
-        return sha256_hash("")
+        return sha256_bytes(b"")
     
-    current_level = [sha256_hash(tx) for tx in transaction]
-    
-    while len(current_level) > 1:
-        next_level = []
-        i = 0
-        while i < len(current_level):
-            left_hash = current_level[i]
-            right_hash = current_level[i + 1] if i + 1 < len(current_level) else left_hash
-            combined_hash = left_hash + right_hash
-            new_parent_hash = sha256_hash(combined_hash)
-            next_level.append(new_parent_hash)
-            i += 2
-        
-        current_level = next_level
+    return _root(*_leaf_buffer(_leaf_digest(tx) for tx in transaction))
+
+def merkle_root_from_leaves(leaves: List[bytes]) -> str:
+    if not leaves:
+        return sha256_bytes(b"")
     
-    return current_level[0]
+    return _root(*_leaf_buffer(sha256_bin(leaf) for leaf in leaves))
 
 def merkle_proof(transactions: List[Union[str, Dict]], target_tx: Union[str, Dict]) -> List[Tuple[str, str]]:
 
     if not transactions:
         return []
     
-    current_level = [sha256_hash(tx) for tx in transactions]
-    target_hash = sha256_hash(target_tx)
+    digests = [_leaf_digest(tx) for tx in transactions]
     
     try:
-        index = current_level.index(target_hash)
+        index = digests.index(_leaf_digest(target_tx))
     except ValueError:
         return []  
     
     proof = []
+    buf, n = _leaf_buffer(digests)
     
-    while len(current_level) > 1:
-        next_level = []
-        i = 0
-        new_index = None
-        
-        while i < len(current_level):
-            left_hash = current_level[i]
-            right_hash = current_level[i + 1] if i + 1 < len(current_level) else left_hash
-            combined_hash = left_hash + right_hash
-            new_parent_hash = sha256_hash(combined_hash)
-            next_level.append(new_parent_hash)
-            
-            if i == index:
-                if i + 1 < len(current_level):
-                    proof.append((right_hash, "right")) 
-                new_index = len(next_level) - 1
-            elif i + 1 == index:
-                proof.append((left_hash, "left"))  
-                new_index = len(next_level) - 1
+    with memoryview(buf) as view:
+        while n > 1:
+            # An odd last node is its own sibling
+            sibling = min(index ^ 1, n - 1)
+            position = "left" if index & 1 else "right"
+            proof.append((view[sibling * 32:sibling * 32 + 32].hex(), position))
             
-            i += 2
-        
-        current_level = next_level
-        index = new_index
+            n = _hash_level(view, n)
+            index //= 2
     
     return proof
 
 def verify_merkle_proof(target_tx: Union[str, Dict], proof: List[Tuple[str, str]], merkle_root_hash: str) -> bool:
  
-    current_hash = sha256_hash(target_tx)
+    current_hash = _leaf_digest(target_tx)
     
     for sibling_hash, position in proof:
+        sibling = bytes.fromhex(sibling_hash)
         if position == "left":
-            combined_hash = sibling_hash + current_hash
+            combined_hash = sibling + current_hash
         else:  
-            combined_hash = current_hash + sibling_hash
+            combined_hash = current_hash + sibling
         
-        current_hash = sha256_hash(combined_hash)
+        current_hash = sha256_bin(combined_hash)
     
-    return current_hash == merkle_root_hash
+    return current_hash.hex() == merkle_root_hash
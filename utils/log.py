@@ -0,0 +1,32 @@
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from config import LoggingConfig
+
+_listener: "logging.handlers.QueueListener | None" = None
+
+def _configure():
+    global _listener
+    if _listener is not None:
+        return
+    
+    # Records are handed to a queue; formatting for output and the stdout
+    # write happen on the listener's background thread.
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(logging.Formatter("%(message)s"))
+    
+    _listener = logging.handlers.QueueListener(log_queue, stream)
+    _listener.start()
+    atexit.register(_listener.stop)
+    
+    root = logging.getLogger("blockchain")
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(LoggingConfig.LEVEL)
+    root.propagate = False
+
+def get_logger(name: str) -> logging.Logger:
+    _configure()
+    return logging.getLogger(f"blockchain.{name}")
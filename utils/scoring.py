@@ -0,0 +1,92 @@
+import numpy as np
+from typing import Callable, Final, Optional
+from config import PriorityConfig, ValidatorScoringConfig
+
+# Bound at module level so numba folds them into the batch kernel as constants
+ALPHA: Final[float] = PriorityConfig.ALPHA
+BETA: Final[float] = PriorityConfig.BETA
+GAMMA: Final[float] = PriorityConfig.GAMMA
+DELTA: Final[float] = PriorityConfig.DELTA
+
+W_STAKE: Final[float] = ValidatorScoringConfig.W_STAKE
+W_REPUTATION: Final[float] = ValidatorScoringConfig.W_REPUTATION
+W_LATENCY: Final[float] = ValidatorScoringConfig.W_LATENCY
+W_CERTIFICATION: Final[float] = ValidatorScoringConfig.W_CERTIFICATION
+W_UPTIME: Final[float] = ValidatorScoringConfig.W_UPTIME
+
+# Class 0 = routine, 1 = normal, 2 = emergency; a priority equal to a
+# threshold stays in the lower class (same boundaries as AdaptiveQuorum)
+PRIORITY_THRESHOLDS = np.array([PriorityConfig.NORMAL_THRESHOLD, PriorityConfig.EMERGENCY_THRESHOLD])
+
+# Below this many rows, calling priority per row beats building the arrays
+# and crossing into the batch kernel
+BATCH_MIN_SIZE: Final[int] = 16
+
+def _clamp01(x: float) -> float:
+    # Conditional form instead of min()/max() calls; tx.data inputs are
+    # caller-supplied, so both bounds are needed (NaN maps to 0.0).
+    return 1.0 if x > 1.0 else (x if x > 0.0 else 0.0)
+
+# Scalar helpers stay plain Python: per call they are cheaper than a trip
+# through a numba dispatcher, and importing numba costs ~0.2 s
+def priority(severity: float, urgency: float, risk: float, resource_avail: float = 0.8) -> float:
+    p = ALPHA * severity + BETA * urgency + GAMMA * resource_avail + DELTA * risk
+    return _clamp01(p)
+
+def v_score(stake_norm: float, reputation: float, latency_inv: float, certification: float, uptime: float) -> float:
+    s = (
+        W_STAKE * stake_norm +
+        W_REPUTATION * reputation +
+        W_LATENCY * latency_inv +
+        W_CERTIFICATION * certification +
+        W_UPTIME * uptime
+    )
+    return _clamp01(s)
+
+def _priorities_numpy(severity: np.ndarray, urgency: np.ndarray, risk: np.ndarray, resource_avail: float) -> np.ndarray:
+    p = ALPHA * severity + BETA * urgency + GAMMA * resource_avail + DELTA * risk
+    return np.where(p > 0.0, np.minimum(p, 1.0), 0.0)
+
+def _build_priorities_kernel() -> Callable:
+    try:
+        from numba import njit, prange
+    except ImportError:
+        # numba is optional; without it the batch runs as plain NumPy
+        return _priorities_numpy
+    
+    @njit(parallel=True, cache=True)
+    def kernel(severity, urgency, risk, resource_avail):
+        n = severity.shape[0]
+        out = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            p = ALPHA * severity[i] + BETA * urgency[i] + GAMMA * resource_avail + DELTA * risk[i]
+            out[i] = 1.0 if p > 1.0 else (p if p > 0.0 else 0.0)
+        return out
+    
+    return kernel
+
+_priorities_kernel: Optional[Callable] = None
+
+def priorities(severity: np.ndarray, urgency: np.ndarray, risk: np.ndarray, resource_avail: float = 0.8) -> np.ndarray:
+    """
+    Batch form of priority. numba is imported and the kernel compiled on
+    the first call unless warm_up ran, so only processes that score
+    batches pay for it.
+    """
+    global _priorities_kernel
+    if _priorities_kernel is None:
+        _priorities_kernel = _build_priorities_kernel()
+    return _priorities_kernel(severity, urgency, risk, resource_avail)
+
+def warm_up():
+    """
+    Compile (or load from numba's cache) the batch kernel ahead of first use.
+    Call it from the main thread: numba's default threading layer hangs at
+    exit if a parallel kernel first runs on another thread.
+    """
+    empty = np.zeros(1)
+    priorities(empty, empty, empty)
+
+def priority_classes(priorities) -> np.ndarray:
+    """Routine/normal/emergency class for a scalar or a whole array of priorities at once."""
+    return np.searchsorted(PRIORITY_THRESHOLDS, priorities, side="left")
@@ -0,0 +1,36 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the stdlib fallback is valid JSON but not byte-identical
+    orjson = None
+
+def dumps(obj: Any, sort_keys: bool = False) -> bytes:
+    """
+    Fast JSON for the wire and for display. Not canonical: the bytes depend on
+    whether orjson is installed and on which encoder accepted the value, so
+    never feed them to hashes, ids or signatures; use canonical_dumps there.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+        except TypeError:
+            # orjson rejects what the stdlib coerces (non-str dict keys, ints
+            # beyond 64 bits); the stdlib also orders int keys numerically
+            pass
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+def canonical_dumps(obj: Any) -> bytes:
+    """
+    Canonical JSON for bytes that are hashed or signed. Always the stdlib
+    encoder with fixed settings, so every node produces the same bytes
+    whether or not orjson is installed; NaN and infinities are rejected.
+    """
+    return json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False, allow_nan=False).encode('utf-8')
+
+def loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)